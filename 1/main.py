@@ -1,65 +1,159 @@
 import argparse
-from collections import defaultdict
+import heapq
+import sys
+import tempfile
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Iterator, Optional
 
+import numpy as np
 
-def read_file(file_path: str) -> tuple[list[int], list[int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    left, right = [], []
-    for line in lines:
-        parts = line.split()
-        left.append(int(parts[0]))
-        right.append(int(parts[1]))
+from common.inputs import int_columns, iter_int_chunks, map_file
 
-    return left, right
+# Number of values read from a spilled run at a time while merging
+RUN_BLOCK_SIZE = 1 << 16
+# Most runs merged at once, which bounds the number of open files
+MAX_FAN_IN = 64
 
 
-def sort_and_sum(left: list[int], right: list[int]) -> int:
-    sorted_left = sorted(left)
-    sorted_right = sorted(right)
+def read_file(file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    columns = int_columns(file_path, 2)
+    return columns[:, 0], columns[:, 1]
 
-    running_sum = 0
-    for l_val, r_val in zip(sorted_left, sorted_right):
-        running_sum += abs(l_val - r_val)
 
-    return running_sum
+def sort_and_sum(left: np.ndarray, right: np.ndarray) -> int:
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
 
 
-def part_1(file_path: str):
-    left, right = read_file(file_path)
-    output = sort_and_sum(left, right)
-    print(output)
+def calculate_similarity_score(left: np.ndarray, right: np.ndarray) -> int:
+    values, counts = np.unique(right, return_counts=True)
+    indices = np.searchsorted(values, left)
+    found = indices < len(values)
+    found[found] = values[indices[found]] == left[found]
+    return int((left[found] * counts[indices[found]]).sum())
+
+
+def spill_sorted_runs(
+    file_path: str, chunk_size: int, run_dir: str
+) -> tuple[list[Path], list[Path]]:
+    runs: tuple[list[Path], list[Path]] = ([], [])
+    pending = np.zeros(0, dtype=np.int64)
+    for values, _ in iter_int_chunks(map_file(file_path), chunk_size):
+        # A chunk can end between the two values of a line
+        values = np.concatenate([pending, values])
+        num_values = len(values) - len(values) % 2
+        pending = values[num_values:]
+        pairs = values[:num_values].reshape(-1, 2)
+        for column, column_runs in enumerate(runs):
+            path = Path(run_dir) / f"{column}_{len(column_runs)}.bin"
+            np.sort(pairs[:, column]).tofile(path)
+            column_runs.append(path)
+
+    assert len(pending) == 0
+    return runs
+
+
+def iter_run(path: Path) -> Iterator[int]:
+    with open(path, "rb") as file:
+        while True:
+            block = np.fromfile(file, dtype=np.int64, count=RUN_BLOCK_SIZE)
+            if len(block) == 0:
+                return
+
+            yield from block.tolist()
+
+
+def write_run(values: Iterator[int], path: Path):
+    with open(path, "wb") as file:
+        while block := list(islice(values, RUN_BLOCK_SIZE)):
+            np.array(block, dtype=np.int64).tofile(file)
+
+
+def reduce_runs(paths: list[Path], fan_in: int = MAX_FAN_IN) -> list[Path]:
+    # Merges groups of runs into longer ones until a single merge can take them
+    # all, deleting each group once it has been written out
+    while len(paths) > fan_in:
+        merged_paths: list[Path] = []
+        for i in range(0, len(paths), fan_in):
+            group = paths[i : i + fan_in]
+            merged_path = group[0].with_name(f"{group[0].stem}_{len(paths)}.bin")
+            write_run(heapq.merge(*(iter_run(path) for path in group)), merged_path)
+            for path in group:
+                path.unlink()
+
+            merged_paths.append(merged_path)
+
+        paths = merged_paths
 
+    return paths
 
-def calculate_similarity_score(left: list[int], right: list[int]) -> int:
-    entries: dict[int, int] = defaultdict(int)
-    for value in right:
-        entries[value] += 1
 
-    similarity_score = 0
-    for value in left:
-        if value in entries:
-            similarity_score += value * entries[value]
+def merge_runs(paths: list[Path]) -> Iterator[int]:
+    return heapq.merge(*(iter_run(path) for path in reduce_runs(paths)))
+
+
+def count_values(sorted_values: Iterator[int]) -> Iterator[tuple[int, int]]:
+    for value, group in groupby(sorted_values):
+        yield value, sum(1 for _ in group)
+
+
+def sort_and_sum_streaming(file_path: str, chunk_size: int) -> int:
+    with tempfile.TemporaryDirectory() as run_dir:
+        left_runs, right_runs = spill_sorted_runs(file_path, chunk_size, run_dir)
+        return sum(
+            abs(l_val - r_val)
+            for l_val, r_val in zip(merge_runs(left_runs), merge_runs(right_runs))
+        )
+
+
+def calculate_similarity_score_streaming(file_path: str, chunk_size: int) -> int:
+    with tempfile.TemporaryDirectory() as run_dir:
+        left_runs, right_runs = spill_sorted_runs(file_path, chunk_size, run_dir)
+        right_counts = count_values(merge_runs(right_runs))
+        right_value, right_count = next(right_counts, (None, 0))
+
+        similarity_score = 0
+        for value, count in count_values(merge_runs(left_runs)):
+            while right_value is not None and right_value < value:
+                right_value, right_count = next(right_counts, (None, 0))
+
+            if right_value == value:
+                similarity_score += value * count * right_count
+
+        return similarity_score
+
+
+def part_1(file_path: str, chunk_size: Optional[int] = None):
+    if chunk_size is not None:
+        return sort_and_sum_streaming(file_path, chunk_size)
+
+    left, right = read_file(file_path)
+    output = sort_and_sum(left, right)
+    return output
 
-    return similarity_score
 
+def part_2(file_path: str, chunk_size: Optional[int] = None):
+    if chunk_size is not None:
+        return calculate_similarity_score_streaming(file_path, chunk_size)
 
-def part_2(file_path: str):
     left, right = read_file(file_path)
     output = calculate_similarity_score(left, right)
-    print(output)
+    return output
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    # Stream the lists in chunks of this many bytes, spilling sorted runs to disk
+    parser.add_argument("-c", "--chunk-size", type=int, default=None)
     results = parser.parse_args()
 
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path, results.chunk_size))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path, results.chunk_size))
@@ -1,131 +1,80 @@
 import argparse
-from collections import defaultdict
+import sys
+from pathlib import Path
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import OFFSETS, Grid, shift
+
+PEAK = 9
+# Upper bound on the size of the reachable peak bitsets held at once
+MAX_BITSET_BYTES = 1 << 26
+
 
 def read_file(
     file_path: str,
 ) -> np.ndarray:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    return np.array([[int(x) for x in line.strip()] for line in lines])
-
-
-def read_map(
-    map: np.ndarray,
-) -> tuple[
-    set[tuple[int, int]],
-    set[tuple[int, int]],
-    dict[tuple[int, int], set[tuple[int, int]]],
-]:
-    rows, cols = map.shape
-    graph: dict[tuple[int, int], set[tuple[int, int]]] = defaultdict(set)
-    trailheads: set[tuple[int, int]] = set()
-    peaks: set[tuple[int, int]] = set()
-
-    for row in range(rows):
-        for col in range(cols):
-            current_pos = (row, col)
-            height = map[row, col]
-            if height == 0:
-                trailheads.add(current_pos)
-
-            if height == 9:
-                peaks.add(current_pos)
-
-            if row != 0:
-                other_pos = (row - 1, col)
-                other_height = map[row - 1, col]
-                if height - other_height == 1:
-                    graph[other_pos].add(current_pos)
-
-                if other_height - height == 1:
-                    graph[current_pos].add(other_pos)
-
-            if col != 0:
-                other_pos = (row, col - 1)
-                other_height = map[row, col - 1]
-                if height - other_height == 1:
-                    graph[other_pos].add(current_pos)
-
-                if other_height - height == 1:
-                    graph[current_pos].add(other_pos)
-
-    return trailheads, peaks, graph
-
-
-def count_trails(
-    trailheads: set[tuple[int, int]],
-    peaks: set[tuple[int, int]],
-    graph: dict[tuple[int, int], set[tuple[int, int]]],
-) -> int:
-
-    def dfs_helper(
-        graph: dict[tuple[int, int], set[tuple[int, int]]],
-        starting_point: tuple[int, int],
-    ) -> set[tuple[int, int]]:
-        visited = set()
-        node_stack = [starting_point]
-
-        while node_stack:
-            current_node = node_stack.pop()
-            visited.add(current_node)
-
-            for child in graph[current_node]:
-                if child not in visited and child not in node_stack:
-                    node_stack.append(child)
-
-        return visited
-
-    num_trails = 0
-    for trailhead in trailheads:
-        visited = dfs_helper(graph, trailhead)
-        num_trails += len(visited.intersection(peaks))
-
-    return num_trails
+    return Grid.from_file(file_path).cells.astype(int) - ord("0")
 
 
-def part_1(file_path: str):
-    topo_map = read_file(file_path)
-    trailheads, peaks, graph = read_map(topo_map)
-    print(count_trails(trailheads, peaks, graph))
+def combine_uphill(
+    topo_map: np.ndarray, values: np.ndarray, height: int, combine: np.ufunc
+) -> np.ndarray:
+    # Combines the values of the neighbors one step higher than each cell
+    upper = topo_map == height + 1
+    if values.ndim == 3:
+        upper = upper[..., None]
 
+    upper_values = np.where(upper, values, 0)
+    result = np.zeros_like(values)
+    for d_row, d_col in OFFSETS.tolist():
+        result = combine(result, shift(upper_values, d_row, d_col))
 
-def count_ratings(trailheads: set[tuple[int, int]], peaks: set[tuple[int, int]], graph: dict[tuple[int, int], set[tuple[int, int]]]) -> int:
+    return result
 
-    def dfs_helper(
-        graph: dict[tuple[int, int], set[tuple[int, int]]],
-        starting_point: tuple[int, int],
-    ) -> dict[tuple[int, int], int]:
-        visit_counts: dict[tuple[int, int], int] = defaultdict(int)
-        node_stack = [starting_point]
 
-        while node_stack:
-            current_node = node_stack.pop()
-            visit_counts[current_node] += 1
+def count_trails(topo_map: np.ndarray) -> int:
+    # Each cell holds a bitset of the peaks it can reach, packed into bytes and
+    # processed a block of peaks at a time to bound the memory used
+    peaks = np.argwhere(topo_map == PEAK)
+    block_bytes = max(1, MAX_BITSET_BYTES // topo_map.size)
+    num_trails = 0
+    for block_start in range(0, len(peaks), block_bytes * 8):
+        block = peaks[block_start : block_start + block_bytes * 8]
+        indices = np.arange(len(block))
+        reachable = np.zeros(topo_map.shape + ((len(block) + 7) // 8,), np.uint8)
+        reachable[block[:, 0], block[:, 1], indices // 8] = 1 << (indices % 8)
+        for height in reversed(range(PEAK)):
+            uphill = combine_uphill(topo_map, reachable, height, np.bitwise_or)
+            layer = topo_map == height
+            reachable[layer] = uphill[layer]
+
+        num_trails += int(np.unpackbits(reachable[topo_map == 0]).sum())
 
-            for child in graph[current_node]:
-                node_stack.append(child)
+    return num_trails
 
-        return visit_counts
 
-    ratings = 0
-    for trailhead in trailheads:
-        visit_counts = dfs_helper(graph, trailhead)
+def part_1(file_path: str):
+    topo_map = read_file(file_path)
+    return count_trails(topo_map)
 
-        for peak in peaks:
-            ratings += visit_counts[peak]
 
-    return ratings
+def count_ratings(topo_map: np.ndarray) -> int:
+    # Each cell holds the number of distinct trails from it to any peak
+    ratings = (topo_map == PEAK).astype(np.int64)
+    for height in reversed(range(PEAK)):
+        uphill = combine_uphill(topo_map, ratings, height, np.add)
+        layer = topo_map == height
+        ratings[layer] = uphill[layer]
 
+    return int(ratings[topo_map == 0].sum())
 
 
 def part_2(file_path: str):
     topo_map = read_file(file_path)
-    trailheads, peaks, graph = read_map(topo_map)
-    print(count_ratings(trailheads, peaks, graph))
+    return count_ratings(topo_map)
 
 
 if __name__ == "__main__":
@@ -137,6 +86,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
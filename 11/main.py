@@ -1,15 +1,19 @@
 import argparse
+import sys
 from collections import defaultdict
+from pathlib import Path
 from time import time
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.inputs import map_file, parse_ints
+from common.progress import progress, set_verbose
 
-def read_file(file_path: str) -> list[int]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        text = file.read()
 
-    return [int(x) for x in text.strip().split()]
+def read_file(file_path: str) -> list[int]:
+    return parse_ints(map_file(file_path)).tolist()
 
 
 def digits(num: int) -> int:
@@ -41,7 +45,7 @@ def part_1(file_path: str):
     stones = read_file(file_path)
     for _ in range(25):
         update_stones(stones)
-    print(len(stones))
+    return len(stones)
 
 
 def graph_stone_count(stones: list[int], blinks: int) -> int:
@@ -114,18 +118,22 @@ def part_2(file_path: str):
     for i in range(75):
         start = time()
         memoized_blink(stone_dict)
-        print(i + 1, sum(stone_dict.values()), time() - start)
+        progress(i + 1, sum(stone_dict.values()), time() - start)
+
+    return sum(stone_dict.values())
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
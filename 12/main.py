@@ -1,42 +1,29 @@
 import argparse
+import sys
 from collections import defaultdict
 from itertools import product
+from pathlib import Path
 
+import numpy as np
 
-def read_file(file_path: str) -> tuple[list[list[str]], tuple[int, int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    garden_map: list[list[str]] = []
-    for line in lines:
-        line = line.strip()
-        row = []
-        for char in line:
-            row.append(char)
+from common.grid import OFFSETS, Grid
 
-        garden_map.append(row)
 
-    return garden_map, (len(garden_map), len(garden_map[0]))
+def read_file(file_path: str) -> tuple[Grid, tuple[int, int]]:
+    garden_map = Grid.from_file(file_path)
+    return garden_map, garden_map.shape
 
 
 def graph_from_garden_map(
-    garden_map: list[list[str]], map_size: tuple[int, int]
+    garden_map: Grid, map_size: tuple[int, int]
 ) -> dict[tuple[int, int], set[tuple[int, int]]]:
-    num_rows, num_cols = map_size
     graph: dict[tuple[int, int], set[tuple[int, int]]] = defaultdict(set)
-    for row in range(num_rows):
-        for col in range(num_cols):
-            current_char = garden_map[row][col]
-            if row != 0:
-                above_char = garden_map[row - 1][col]
-                if above_char == current_char:
-                    graph[(row, col)].add((row - 1, col))
-                    graph[(row - 1, col)].add((row, col))
-            if col != 0:
-                above_char = garden_map[row][col - 1]
-                if above_char == current_char:
-                    graph[(row, col)].add((row, col - 1))
-                    graph[(row, col - 1)].add((row, col))
+    same_as_neighbor = garden_map.same_as_neighbor()
+    for direction, (d_row, d_col) in enumerate(OFFSETS.tolist()):
+        for row, col in np.argwhere(same_as_neighbor[direction]).tolist():
+            graph[(row, col)].add((row + d_row, col + d_col))
 
     return graph
 
@@ -76,13 +63,13 @@ def get_fence_cost(
 def part_1(file_path: str):
     garden_map, map_size = read_file(file_path)
     graph = graph_from_garden_map(garden_map, map_size)
-    print(get_fence_cost(graph, map_size))
+    return get_fence_cost(graph, map_size)
 
 
 def get_bulk_fence_cost(
     graph: dict[tuple[int, int], set[tuple[int, int]]],
     map_size: tuple[int, int],
-    garden_map: list[list[str]],
+    garden_map: Grid,
 ) -> int:
     num_rows, num_cols = map_size
     not_yet_visited: set[tuple[int, int]] = set()
@@ -128,8 +115,7 @@ def get_bulk_fence_cost(
 def part_2(file_path: str):
     garden_map, map_size = read_file(file_path)
     graph = graph_from_garden_map(garden_map, map_size)
-    print(get_bulk_fence_cost(graph, map_size, garden_map))
-    pass
+    return get_bulk_fence_cost(graph, map_size, garden_map)
 
 
 if __name__ == "__main__":
@@ -141,6 +127,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
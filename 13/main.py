@@ -1,11 +1,17 @@
 import argparse
 import heapq
 import re
+import sys
 from collections import namedtuple
 from itertools import product
+from pathlib import Path
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import progress, set_verbose
+
 Game = namedtuple("Game", ["a", "b", "prize"])
 Vector = namedtuple("Vector", ["x", "y"])
 Press = namedtuple("Press", ["a", "b"])
@@ -85,7 +91,7 @@ def solve_games(games: list[Game]) -> int:
 
         # Matrix is singular
         except np.linalg.LinAlgError:
-            print(game)
+            progress(game)
 
     return cost
 
@@ -121,8 +127,8 @@ def solve_games_dp(games: list[Game]) -> int:
         if c[-1, -1] != np.inf:
             total_cost += c[-1, -1]
 
-        print(c)
-        print(prev)
+        progress(c)
+        progress(prev)
     return total_cost
 
 
@@ -238,7 +244,7 @@ def solve_games_systems(games: list[Game]) -> int:
 
 def part_1(file_path: str):
     games = read_file_vector(file_path)
-    print(solve_games_systems(games))
+    return solve_games_systems(games)
 
 
 def solve_games_shifted(games: list[Game], shift: int = 10000000000000) -> int:
@@ -254,7 +260,7 @@ def solve_games_shifted(games: list[Game], shift: int = 10000000000000) -> int:
                 moves, rounded_moves
             ).all():
                 cost += int(np.dot(button_cost, rounded_moves))
-                print(game, moves, rounded_moves)
+                progress(game, moves, rounded_moves)
 
         # Matrix is singular
         except np.linalg.LinAlgError:
@@ -265,18 +271,20 @@ def solve_games_shifted(games: list[Game], shift: int = 10000000000000) -> int:
 
 def part_2(file_path: str):
     games = read_file_vector(file_path, shift=10000000000000)
-    print(solve_games_systems(games))
+    return solve_games_systems(games)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -1,14 +1,21 @@
 import argparse
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from itertools import product
 from math import prod
 from operator import gt, lt
+from pathlib import Path
+from typing import Optional
 
 import numpy as np
 from PIL import Image, ImageColor
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import set_verbose
+
 
 @dataclass
 class State:
@@ -71,7 +78,7 @@ def part_1(file_path: str):
     num_steps = 100
     step(states, board_size, num_steps)
 
-    print(get_safety_factor(states, board_size))
+    return get_safety_factor(states, board_size)
 
 
 def get_color(count: int) -> np.ndarray:
@@ -91,29 +98,66 @@ def save_board(states: list[State], board_size: BoardSize) -> Image:
     return Image.fromarray(image)
 
 
-def part_2(file_path: str):
+def get_safety_factors(
+    states: list[State], board_size: BoardSize, num_steps: int
+) -> np.ndarray:
+    positions = np.array([state.pos for state in states])
+    velocities = np.array([state.vel for state in states])
+    size = np.array([board_size.x, board_size.y])
+    dividers = size // 2
+
+    safety_factors = np.zeros(num_steps, dtype=int)
+    for i in range(num_steps):
+        current = (positions + i * velocities) % size
+        below = current < dividers
+        above = current > dividers
+        safety_factors[i] = (
+            np.sum(below[:, 0] & below[:, 1])
+            * np.sum(below[:, 0] & above[:, 1])
+            * np.sum(above[:, 0] & below[:, 1])
+            * np.sum(above[:, 0] & above[:, 1])
+        )
+
+    return safety_factors
+
+
+def part_2(file_path: str, frames_dir: Optional[str] = None):
     states: list[State] = read_file(file_path)
     if "sample" in file_path:
         board_size = BoardSize(11, 7)
     else:
         board_size = BoardSize(101, 103)
 
-    for i in range(10000):
-        image = save_board(states, board_size)
-        image.save(f"frames/{i}.png")
-        print(i)
-        step(states, board_size)
+    # Positions repeat once every robot has wrapped around both axes
+    num_steps = min(10000, board_size.x * board_size.y)
+
+    if frames_dir is not None:
+        Path(frames_dir).mkdir(parents=True, exist_ok=True)
+        for i in range(num_steps):
+            image = save_board(states, board_size)
+            image.save(Path(frames_dir) / f"{i}.png")
+            step(states, board_size)
+
+        states = read_file(file_path)
+
+    # The picture packs most robots into one quadrant, minimizing the safety factor
+    safety_factors = get_safety_factors(states, board_size, num_steps)
+    return int(np.argmin(safety_factors))
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    # Write every part 2 step as a PNG into this directory
+    parser.add_argument("-f", "--frames", type=str, default=None)
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path, results.frames))
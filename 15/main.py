@@ -1,8 +1,14 @@
 import argparse
+import sys
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import Optional
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import Grid
+
 
 class Direction(Enum):
     UP = 0
@@ -103,34 +109,22 @@ class RobotMap:
             print()
 
 
-def read_file(file_path: str) -> tuple[RobotMap, list[Direction]]:
+def read_grid_and_directions(file_path: str) -> tuple[Grid, str]:
     with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+        map_text, direction_text = file.read().split("\n\n")
 
-    split_line = lines.index("\n")
-    map_lines = lines[:split_line]
-    direction_lines = lines[split_line + 1 :]
+    grid = Grid.from_lines(map_text.split())
+    return grid, "".join(direction_text.split())
 
-    robot_position: Optional[Position] = None
-    box_positions: set[Position] = set()
-    wall_positions: set[Position] = set()
-    for y, line in enumerate(map_lines):
-        for x, char in enumerate(line):
-            if char == "O":
-                box_positions.add(Position(x, y))
 
-            if char == "@":
-                robot_position = Position(x, y)
-
-            if char == "#":
-                wall_positions.add(Position(x, y))
+def read_file(file_path: str) -> tuple[RobotMap, list[Direction]]:
+    grid, direction_str = read_grid_and_directions(file_path)
 
-    assert robot_position
-    robot_map = RobotMap(robot_position, box_positions, wall_positions)
+    box_positions = {Position(x, y) for y, x in grid.find("O").tolist()}
+    wall_positions = {Position(x, y) for y, x in grid.find("#").tolist()}
+    robot_y, robot_x = grid.find_one("@")
+    robot_map = RobotMap(Position(robot_x, robot_y), box_positions, wall_positions)
 
-    direction_str = "".join(
-        [direction_line.strip() for direction_line in direction_lines]
-    )
     direction_list: list[Direction] = []
     for char in direction_str:
         direction = Direction.from_char(char)
@@ -145,7 +139,7 @@ def part_1(file_path: str):
     for direction in direction_list:
         robot_map.check_move(direction)
 
-    print(robot_map.sum_gps())
+    return robot_map.sum_gps()
 
 
 @dataclass
@@ -252,47 +246,33 @@ class WideRobotMap:
 
 
 def read_file_wide(file_path: str) -> tuple[WideRobotMap, list[Direction]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    split_line = lines.index("\n")
-    map_lines = lines[:split_line]
-    direction_lines = lines[split_line + 1 :]
+    grid, direction_str = read_grid_and_directions(file_path)
 
-    robot_position: Optional[Position] = None
     left_box_positions: set[Position] = set()
     right_box_positions: set[Position] = set()
-    wall_positions: set[Position] = set()
     box_pairs: dict[Position, Position] = {}
-    for y, line in enumerate(map_lines):
-        for x, char in enumerate(line):
-            if char == "O":
-                left = Position(2 * x, y)
-                right = Position(2 * x + 1, y)
-                left_box_positions.add(left)
-                right_box_positions.add(right)
-                box_pairs[left] = right
-                box_pairs[right] = left
-
-            if char == "@":
-                robot_position = Position(2 * x, y)
-
-            if char == "#":
-                wall_positions.add(Position(2 * x, y))
-                wall_positions.add(Position(2 * x + 1, y))
-
-    assert robot_position
+    for y, x in grid.find("O").tolist():
+        left = Position(2 * x, y)
+        right = Position(2 * x + 1, y)
+        left_box_positions.add(left)
+        right_box_positions.add(right)
+        box_pairs[left] = right
+        box_pairs[right] = left
+
+    wall_positions: set[Position] = set()
+    for y, x in grid.find("#").tolist():
+        wall_positions.add(Position(2 * x, y))
+        wall_positions.add(Position(2 * x + 1, y))
+
+    robot_y, robot_x = grid.find_one("@")
     robot_map = WideRobotMap(
-        robot_position,
+        Position(2 * robot_x, robot_y),
         left_box_positions,
         right_box_positions,
         box_pairs,
         wall_positions,
     )
 
-    direction_str = "".join(
-        [direction_line.strip() for direction_line in direction_lines]
-    )
     direction_list: list[Direction] = []
     for char in direction_str:
         direction = Direction.from_char(char)
@@ -307,7 +287,7 @@ def part_2(file_path: str):
     for direction in direction_list:
         robot_map.check_move(direction)
 
-    print(robot_map.sum_gps())
+    return robot_map.sum_gps()
 
 
 if __name__ == "__main__":
@@ -319,6 +299,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -4,8 +4,13 @@ import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from itertools import product
-from typing import Optional
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import Grid, shift
 
 STEP_WEIGHT = 1
 ROTATE_WEIGHT = 1000
@@ -54,38 +59,9 @@ class MapSize:
     height: int
 
 
-class PositionType(Enum):
-    WALL = 0
-    OPEN = 1
-    START = 2
-    END = 3
-
-    @classmethod
-    def from_char(cls, char: str) -> Optional["PositionType"]:
-        chars = ["#", ".", "S", "E"]
-        try:
-            index = chars.index(char)
-            return PositionType(index)
-
-        except ValueError:
-            return None
-
-
-def read_file(file_path: str) -> tuple[list[list[PositionType]], MapSize]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    position_types: list[list[PositionType]] = []
-    for line in lines:
-        row: list[PositionType] = []
-        for char in line:
-            position_type = PositionType.from_char(char)
-            if position_type:
-                row.append(position_type)
-
-        position_types.append(row)
-
-    return position_types, MapSize(len(position_types[0]), len(position_types))
+def read_file(file_path: str) -> tuple[Grid, MapSize]:
+    grid = Grid.from_file(file_path)
+    return grid, MapSize(grid.num_cols, grid.num_rows)
 
 
 @dataclass(frozen=True)
@@ -103,73 +79,62 @@ class Movement:
 MazeGraph = dict[State, set[Movement]]
 
 
-def graph_from_position_types(
-    position_types: list[list[PositionType]], map_size: MapSize
-) -> tuple[MazeGraph, Position, Position]:
+def graph_from_grid(grid: Grid) -> tuple[MazeGraph, Position, Position]:
     maze_graph: MazeGraph = defaultdict(set)
-    start_position: Optional[Position] = None
-    end_position: Optional[Position] = None
-    for x, y in product(range(map_size.width), range(map_size.height)):
-        position_type = position_types[y][x]
-        if position_type != PositionType.WALL:
-            current_position = Position(x, y)
-
-            # Rotation
-            for direction in Direction:
-                current_state = State(current_position, direction)
-
-                # Clockwise rotation
-                cw = Direction.rotate_cw(direction)
-                cw_state = State(current_position, cw)
-                cw_movement = Movement(cw_state, ROTATE_WEIGHT)
-                maze_graph[current_state].add(cw_movement)
-
-                # Counterclockwise rotation
-                ccw = Direction.rotate_ccw(direction)
-                ccw_state = State(current_position, ccw)
-                ccw_movement = Movement(ccw_state, ROTATE_WEIGHT)
-                maze_graph[current_state].add(ccw_movement)
-
-            # Translation
-            # Up and down
-            if y > 0:
-                other_position_type = position_types[y - 1][x]
-                if other_position_type != PositionType.WALL:
-                    current_up_state = State(current_position, Direction.UP)
-                    other_position = Position(x, y - 1)
-                    other_up_state = State(other_position, Direction.UP)
-                    up_movement = Movement(other_up_state, STEP_WEIGHT)
-                    maze_graph[current_up_state].add(up_movement)
-
-                    current_down_state = State(current_position, Direction.DOWN)
-                    other_down_state = State(other_position, Direction.DOWN)
-                    down_movement = Movement(current_down_state, STEP_WEIGHT)
-                    maze_graph[other_down_state].add(down_movement)
-
-            # Left and right
-            if x > 0:
-                other_position_type = position_types[y][x - 1]
-                if other_position_type != PositionType.WALL:
-                    current_left_state = State(current_position, Direction.LEFT)
-                    other_position = Position(x - 1, y)
-                    other_left_state = State(other_position, Direction.LEFT)
-                    left_movement = Movement(other_left_state, STEP_WEIGHT)
-                    maze_graph[current_left_state].add(left_movement)
-
-                    current_right_state = State(current_position, Direction.RIGHT)
-                    other_right_state = State(other_position, Direction.RIGHT)
-                    right_movement = Movement(current_right_state, STEP_WEIGHT)
-                    maze_graph[other_right_state].add(right_movement)
-
-        if position_type == PositionType.START:
-            start_position = Position(x, y)
-
-        if position_type == PositionType.END:
-            end_position = Position(x, y)
-
-    assert start_position and end_position
-
-    return maze_graph, start_position, end_position
+    open_cells = ~grid.mask("#")
+
+    # Rotation
+    for y, x in np.argwhere(open_cells).tolist():
+        current_position = Position(x, y)
+        for direction in Direction:
+            current_state = State(current_position, direction)
+
+            # Clockwise rotation
+            cw = Direction.rotate_cw(direction)
+            cw_state = State(current_position, cw)
+            cw_movement = Movement(cw_state, ROTATE_WEIGHT)
+            maze_graph[current_state].add(cw_movement)
+
+            # Counterclockwise rotation
+            ccw = Direction.rotate_ccw(direction)
+            ccw_state = State(current_position, ccw)
+            ccw_movement = Movement(ccw_state, ROTATE_WEIGHT)
+            maze_graph[current_state].add(ccw_movement)
+
+    # Translation
+    # Up and down
+    open_above = open_cells & shift(open_cells, -1, 0, fill=False)
+    for y, x in np.argwhere(open_above).tolist():
+        current_position = Position(x, y)
+        current_up_state = State(current_position, Direction.UP)
+        other_position = Position(x, y - 1)
+        other_up_state = State(other_position, Direction.UP)
+        up_movement = Movement(other_up_state, STEP_WEIGHT)
+        maze_graph[current_up_state].add(up_movement)
+
+        current_down_state = State(current_position, Direction.DOWN)
+        other_down_state = State(other_position, Direction.DOWN)
+        down_movement = Movement(current_down_state, STEP_WEIGHT)
+        maze_graph[other_down_state].add(down_movement)
+
+    # Left and right
+    open_left = open_cells & shift(open_cells, 0, -1, fill=False)
+    for y, x in np.argwhere(open_left).tolist():
+        current_position = Position(x, y)
+        current_left_state = State(current_position, Direction.LEFT)
+        other_position = Position(x - 1, y)
+        other_left_state = State(other_position, Direction.LEFT)
+        left_movement = Movement(other_left_state, STEP_WEIGHT)
+        maze_graph[current_left_state].add(left_movement)
+
+        current_right_state = State(current_position, Direction.RIGHT)
+        other_right_state = State(other_position, Direction.RIGHT)
+        right_movement = Movement(current_right_state, STEP_WEIGHT)
+        maze_graph[other_right_state].add(right_movement)
+
+    start_y, start_x = grid.find_one("S")
+    end_y, end_x = grid.find_one("E")
+    return maze_graph, Position(start_x, start_y), Position(end_x, end_y)
 
 
 def get_scores_djikstra(
@@ -205,12 +170,10 @@ def get_scores_djikstra(
 
 
 def part_1(file_path: str):
-    position_types, map_size = read_file(file_path)
-    maze_graph, start_position, end_position = graph_from_position_types(
-        position_types, map_size
-    )
+    grid, _ = read_file(file_path)
+    maze_graph, start_position, end_position = graph_from_grid(grid)
     score, _ = get_scores_djikstra(maze_graph, start_position)
-    print(min(score[State(end_position, direction)] for direction in Direction))
+    return min(score[State(end_position, direction)] for direction in Direction)
 
 
 def get_best_path_positions(
@@ -243,12 +206,10 @@ def get_best_path_positions(
 
 
 def part_2(file_path: str):
-    position_types, map_size = read_file(file_path)
-    maze_graph, start_position, end_position = graph_from_position_types(
-        position_types, map_size
-    )
+    grid, _ = read_file(file_path)
+    maze_graph, start_position, end_position = graph_from_grid(grid)
     score, prev = get_scores_djikstra(maze_graph, start_position)
-    print(get_best_path_positions(score, prev, end_position))
+    return get_best_path_positions(score, prev, end_position)
 
 
 if __name__ == "__main__":
@@ -260,6 +221,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -1,7 +1,13 @@
 import argparse
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import progress, set_verbose
+
 State = tuple[int, int, int] # B, C, i
 
 @dataclass
@@ -97,8 +103,8 @@ def read_file(file_path: str) -> InstructionSet:
 
 def part_1(file_path: str):
     instruction_set = read_file(file_path)
-    print(instruction_set)
-    print(",".join(str(x) for x in instruction_set.run_program()))
+    progress(instruction_set)
+    return ",".join(str(x) for x in instruction_set.run_program())
 
 
 def part_2(file_path: str):
@@ -116,20 +122,23 @@ def part_2(file_path: str):
             out = instruction_set.run_program()
             x += 1
         prev_a = prev_a * 8 + x - 1
-        print(prev_a)
+        progress(prev_a)
         start -= 1
 
+    return prev_a
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
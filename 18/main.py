@@ -1,11 +1,16 @@
 import argparse
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from itertools import product
+from pathlib import Path
 from pprint import pprint
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import Grid, shift
+
 
 @dataclass(frozen=True)
 class Coordinate:
@@ -31,28 +36,24 @@ class Board:
     y_size: int
 
     def __post_init__(self):
-        self.board = np.zeros((self.x_size, self.y_size))
+        # Indexed [x, y], so rows of the grid are x coordinates
+        self.board = Grid.full(self.x_size, self.y_size, ".")
         self.start = Coordinate(0, 0)
         self.finish = Coordinate(self.x_size - 1, self.y_size - 1)
 
     def add_obstacle(self, coordinate: Coordinate):
-        self.board[coordinate.x, coordinate.y] = 1
+        self.board[coordinate.x, coordinate.y] = "#"
 
     def generate_graph(self) -> Graph:
         graph: Graph = defaultdict(set)
-        for x, y in product(range(self.x_size), range(self.y_size)):
-            if not self.board[x, y]:
-                if x != 0 and not self.board[x - 1, y]:
-                    here = Coordinate(x, y)
-                    there = Coordinate(x - 1, y)
-                    graph[here].add(there)
-                    graph[there].add(here)
-
-                if y != 0 and not self.board[x, y - 1]:
-                    here = Coordinate(x, y)
-                    there = Coordinate(x, y - 1)
-                    graph[here].add(there)
-                    graph[there].add(here)
+        free = self.board.mask(".")
+        for d_x, d_y in [(-1, 0), (0, -1)]:
+            linked = free & shift(free, d_x, d_y, fill=False)
+            for x, y in np.argwhere(linked).tolist():
+                here = Coordinate(x, y)
+                there = Coordinate(x + d_x, y + d_y)
+                graph[here].add(there)
+                graph[there].add(here)
 
         return graph
 
@@ -60,7 +61,7 @@ class Board:
         string = ""
         for y in range(self.y_size):
             for x in range(self.x_size):
-                string += "#" if self.board[x, y] else "."
+                string += self.board[x, y]
 
             string += "\n"
 
@@ -72,7 +73,7 @@ class Board:
             for x in range(self.x_size):
                 if Coordinate(x, y) in path:
                     string += "O"
-                elif self.board[x, y]:
+                elif self.board[x, y] == "#":
                     string += "#"
                 else:
                     string += "."
@@ -119,7 +120,7 @@ def part_1(file_path: str):
 
     graph = board.generate_graph()
     path = bfs(graph, board.start, board.finish)
-    print(len(path))
+    return len(path)
 
 
 def part_2(file_path: str):
@@ -137,8 +138,7 @@ def part_2(file_path: str):
                 graph = board.generate_graph()
                 path = bfs(graph, board.start, board.finish)
                 if not path:
-                    print(coordinate)
-                    break
+                    return f"{coordinate.x},{coordinate.y}"
     else:
         board = Board(71, 71)
         for coordinate in coordinates[:1024]:
@@ -152,8 +152,7 @@ def part_2(file_path: str):
                 graph = board.generate_graph()
                 path = bfs(graph, board.start, board.finish)
                 if not path:
-                    print(coordinate)
-                    break
+                    return f"{coordinate.x},{coordinate.y}"
 
 
 if __name__ == "__main__":
@@ -165,6 +164,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
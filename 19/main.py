@@ -1,5 +1,11 @@
 import argparse
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import progress, set_verbose
 
 Towel = str
 Pattern = str
@@ -42,7 +48,7 @@ def part_1(file_path: str):
     for pattern in patterns:
         running_sum += has_match(towels, pattern, max_stripes)
 
-    print(running_sum)
+    return running_sum
 
 
 def number_of_matches(towels: list[Towel], pattern: Pattern, max_stripes: int) -> int:
@@ -83,21 +89,23 @@ def part_2(file_path: str):
     max_stripes = max(len(x) for x in towels)
     running_sum = 0
     for i, pattern in enumerate(patterns):
-        print(f"{i+1}/{len(patterns)}")
+        progress(f"{i+1}/{len(patterns)}")
         running_sum += number_of_matches(towels, pattern, max_stripes)
 
-    print(running_sum)
+    return running_sum
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
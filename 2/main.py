@@ -1,58 +1,78 @@
 import argparse
+import sys
+from pathlib import Path
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-def read_file(file_path: str) -> list[list[int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+from common.inputs import int_rows
 
-    return [[int(x) for x in line.split()] for line in lines]
 
+def read_file(file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    # Reports are packed into one zero-padded array alongside their lengths
+    values, row_lengths = int_rows(file_path)
+    row_lengths = row_lengths[row_lengths > 0]
+    reports = np.zeros((len(row_lengths), row_lengths.max(initial=0)), np.int64)
+    reports[np.arange(reports.shape[1]) < row_lengths[:, None]] = values
+    return reports, row_lengths
 
-def is_safe(report: np.ndarray) -> bool:
-    delta = report[1:] - report[:-1]
-    sign = np.sign(delta)
-    return (
-        (1 <= np.abs(delta)).all()
-        and (np.abs(delta) <= 3).all()
-        and (sign == sign[0]).all()
-    )
 
+def is_safe_step(delta: np.ndarray) -> np.ndarray:
+    return (1 <= delta) & (delta <= 3)
 
-def get_num_safe_reports(reports: list[list[int]]) -> int:
-    num_safe = 0
-    for report in reports:
-        report_np = np.array(report)
-        if is_safe(report_np):
-            num_safe += 1
 
-    return num_safe
+def get_good_steps(reports: np.ndarray, lengths: np.ndarray, sign: int) -> np.ndarray:
+    # Steps past the end of a report are padding and never make it unsafe
+    delta = sign * np.diff(reports, axis=1)
+    padding = np.arange(delta.shape[1]) >= lengths[:, None] - 1
+    return is_safe_step(delta) | padding
+
+
+def get_num_safe_reports(reports: np.ndarray, lengths: np.ndarray) -> int:
+    safe = np.zeros(len(reports), dtype=bool)
+    for sign in [1, -1]:
+        safe |= get_good_steps(reports, lengths, sign).all(axis=1)
+
+    return int(safe.sum())
 
 
 def part_1(file_path: str):
-    reports = read_file(file_path)
-    output = get_num_safe_reports(reports)
-    print(output)
+    reports, lengths = read_file(file_path)
+    output = get_num_safe_reports(reports, lengths)
+    return output
+
+
+def get_num_safe_reports_damped(reports: np.ndarray, lengths: np.ndarray) -> int:
+    num_reports, width = reports.shape
+    removed = np.arange(width)
+    safe = np.zeros(num_reports, dtype=bool)
+    for sign in [1, -1]:
+        good = get_good_steps(reports, lengths, sign)
+        ones = np.ones((num_reports, 1), dtype=bool)
+        # prefix[:, i] is set when steps 0..i-1 are good, suffix[:, i] for i onwards
+        prefix = np.logical_and.accumulate(np.hstack([ones, good]), axis=1)
+        suffix = np.logical_and.accumulate(np.hstack([good, ones])[:, ::-1], axis=1)
+        suffix = suffix[:, ::-1]
+
+        # Removing value i keeps steps before i - 1 and from i + 1 onwards, and
+        # joins values i - 1 and i + 1 with a new step
+        before = prefix[:, np.maximum(removed - 1, 0)]
+        after = suffix[:, np.minimum(removed + 1, width - 1)]
+        bridge = np.ones((num_reports, width), dtype=bool)
+        bridge[:, 1:-1] = is_safe_step(sign * (reports[:, 2:] - reports[:, :-2]))
+        bridge |= removed >= lengths[:, None] - 1
 
+        candidates = before & after & bridge & (removed < lengths[:, None])
+        safe |= candidates.any(axis=1)
 
-def get_num_safe_reports_damped(reports: list[list[int]]) -> int:
-    num_safe = 0
-    for report in reports:
-        if is_safe(np.array(report)):
-            num_safe += 1
-            continue
-        for i in range(len(report)):
-            if is_safe(np.array(report[:i] + report[i+1:])):
-                num_safe += 1
-                break
-    return num_safe
+    return int(safe.sum())
 
 
 def part_2(file_path: str):
-    reports = read_file(file_path)
-    output = get_num_safe_reports_damped(reports)
-    print(output)
+    reports, lengths = read_file(file_path)
+    output = get_num_safe_reports_damped(reports, lengths)
+    return output
 
 
 if __name__ == "__main__":
@@ -64,6 +84,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -1,10 +1,18 @@
 import argparse
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from itertools import product
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import Grid, shift
+
 
 @dataclass(frozen=True)
 class Position:
@@ -71,47 +79,30 @@ class RaceMap:
 def read_file(
     file_path: str,
 ) -> RaceMap:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    x_size = len(lines[0]) - 1  # Remove newline character
-    y_size = len(lines)
-    start = None
-    end = None
-    path_positions: set[Position] = set()
-    obstacle_positions: set[Position] = set()
-    graph: dict[Position, set[Position]] = defaultdict(set)
+    grid = Grid.from_file(file_path)
+    track = grid.mask(".SE")
+    path_positions = {Position(x, y) for y, x in np.argwhere(track).tolist()}
+    obstacle_positions = {Position(x, y) for y, x in np.argwhere(~track).tolist()}
 
-    for y, line in enumerate(lines):
-        for x, character in enumerate(line.strip()):
+    graph: dict[Position, set[Position]] = defaultdict(set)
+    for d_y, d_x in [(0, -1), (-1, 0)]:
+        linked = track & shift(track, d_y, d_x, fill=False)
+        for y, x in np.argwhere(linked).tolist():
             pos = Position(x, y)
-            if character in ".SE":
-                path_positions.add(pos)
-                if character == "S":
-                    start = pos
-
-                if character == "E":
-                    end = pos
-
-                if x > 0:
-                    other_pos = Position(x - 1, y)
-                    if other_pos in path_positions:
-                        graph[pos].add(other_pos)
-                        graph[other_pos].add(pos)
-
-                if y > 0:
-                    other_pos = Position(x, y - 1)
-                    if other_pos in path_positions:
-                        graph[pos].add(other_pos)
-                        graph[other_pos].add(pos)
-
-            else:
-                obstacle_positions.add(pos)
-
-    assert start and end
+            other_pos = Position(x + d_x, y + d_y)
+            graph[pos].add(other_pos)
+            graph[other_pos].add(pos)
 
+    start_y, start_x = grid.find_one("S")
+    end_y, end_x = grid.find_one("E")
     return RaceMap(
-        x_size, y_size, start, end, path_positions, obstacle_positions, graph
+        grid.num_cols,
+        grid.num_rows,
+        Position(start_x, start_y),
+        Position(end_x, end_y),
+        path_positions,
+        obstacle_positions,
+        graph,
     )
 
 
@@ -156,7 +147,7 @@ def part_1(file_path: str):
         if shortcut_length >= 100:
             running_sum += num_shortcuts
 
-    print(running_sum)
+    return running_sum
 
 
 def part_2(file_path: str):
@@ -182,7 +173,7 @@ def part_2(file_path: str):
         if shortcut_length >= 100:
             running_sum += num_shortcuts
 
-    print(running_sum)
+    return running_sum
 
 
 if __name__ == "__main__":
@@ -194,6 +185,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
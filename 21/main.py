@@ -1,6 +1,12 @@
 import argparse
+import sys
 from dataclasses import dataclass
 from itertools import permutations
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import progress, set_verbose
 
 Button = str
 
@@ -201,10 +207,10 @@ def part_1(file_path: str):
         steps = recursive_no_memo(combination)
         value = int("".join(combination[:-1]))
         complexity = value * steps
-        print(value, steps, complexity)
+        progress(value, steps, complexity)
         running_sum += complexity
 
-    print(running_sum)
+    return running_sum
 
 known: dict[tuple[int, Button, ...], int] = {}
 
@@ -245,21 +251,23 @@ def part_2(file_path: str):
         steps = recursive_memo(combination, max_depth=25)
         value = int("".join(combination[:-1]))
         complexity = value * steps
-        print(value, steps, complexity)
+        progress(value, steps, complexity)
         running_sum += complexity
 
-    print(running_sum)
+    return running_sum
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
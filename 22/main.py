@@ -1,14 +1,18 @@
 import argparse
+import sys
 from collections import defaultdict
+from pathlib import Path
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.inputs import int_columns
+from common.progress import progress, set_verbose
 
-def read_file(file_path: str) -> list[int]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
 
-    return [int(x) for x in lines]
+def read_file(file_path: str) -> list[int]:
+    return int_columns(file_path, 1)[:, 0].tolist()
 
 
 def mix(secret_number: int, other: int) -> int:
@@ -32,10 +36,10 @@ def part_1(file_path: str):
         for i in range(2000):
             secret_number = generate_next(secret_number)
 
-        print(secret_number)
+        progress(secret_number)
         running_sum += secret_number
 
-    print(running_sum)
+    return running_sum
 
 
 def part_2(file_path: str):
@@ -44,7 +48,7 @@ def part_2(file_path: str):
     num_monkeys = len(secret_numbers)
     num_steps = 2000
     price_array = np.zeros((num_monkeys, num_steps + 1))
-    print(price_array.shape)
+    progress(price_array.shape)
     for row, secret_number in enumerate(secret_numbers):
         monkey_prices = [secret_number % 10]
         for i in range(num_steps):
@@ -58,7 +62,7 @@ def part_2(file_path: str):
     profits: dict[tuple[int, int, int, int], int] = defaultdict(int)
 
     for i in range(num_monkeys):
-        print(i)
+        progress(i)
         already_bought = defaultdict(bool)
         keys = zip(
             price_changes[i, 0:-3],
@@ -71,7 +75,8 @@ def part_2(file_path: str):
             profits[key] += price * (not already_bought[key])
             already_bought[key] = True
 
-    print(max(profits.items(), key=lambda x: x[1]))
+    progress(max(profits.items(), key=lambda x: x[1]))
+    return int(max(profits.values()))
 
 
 
@@ -81,11 +86,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -40,8 +40,8 @@ def part_1(file_path: str):
                         )
                 stack.append(neighbor)
 
-    print(
-        len({x for x in triples if x[0][0] == "t" or x[1][0] == "t" or x[2][0] == "t"})
+    return len(
+        {x for x in triples if x[0][0] == "t" or x[1][0] == "t" or x[2][0] == "t"}
     )
 
 
@@ -81,7 +81,7 @@ def part_2(file_path: str):
 
     largest_component = max(components, key=len)
 
-    print(",".join(sorted(largest_component)))
+    return ",".join(sorted(largest_component))
 
 
 if __name__ == "__main__":
@@ -93,6 +93,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
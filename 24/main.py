@@ -1,10 +1,16 @@
 import argparse
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import IntEnum, auto
+from pathlib import Path
 from pprint import pprint
 from typing import Optional, Union
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.progress import progress, set_verbose
+
 
 class Operator(IntEnum):
     AND = auto()
@@ -140,35 +146,35 @@ def part_1(file_path: str):
         b = values[b_label]
         values[output_label] = vertex.operator(a, b)
 
-    print(0, end="")
+    progress(0, end="")
     x_keys = sorted([x for x in values if x[0] == "x"], reverse=True)
     x_value = 0
     for x_key in x_keys:
         x_value = (x_value << 1) | values[x_key]
-        print(values[x_key], end="")
-    print()
+        progress(values[x_key], end="")
+    progress()
 
-    print(0, end="")
+    progress(0, end="")
     y_keys = sorted([x for x in values if x[0] == "y"], reverse=True)
     y_value = 0
     for y_key in y_keys:
         y_value = (y_value << 1) | values[y_key]
-        print(values[y_key], end="")
-    print()
+        progress(values[y_key], end="")
+    progress()
 
     z_keys = sorted([x for x in values if x[0] == "z"], reverse=True)
     z_value = 0
     for z_key in z_keys:
         z_value = (z_value << 1) | values[z_key]
-        print(values[z_key], end="")
-    print()
+        progress(values[z_key], end="")
+    progress()
 
     for i in range(45, -1, -1):
-        print(i%10, end="")
-    print()
+        progress(i%10, end="")
+    progress()
 
-    print(x_value + y_value)
-    print(z_value)
+    progress(x_value + y_value)
+    return z_value
 
 
 def reverse_graph(
@@ -223,9 +229,9 @@ def part_2(file_path: str):
         x = f"x{i:02}"
         y = f"y{i:02}"
         z = f"z{i:02}"
-        print(x, y)
+        progress(x, y)
         if graph[x] != graph[y]:
-            print("BONGO")
+            progress("BONGO")
             break
         xor_gate = None
         and_gate = None
@@ -260,25 +266,27 @@ def part_2(file_path: str):
             or_gate_set = graph[and_output]
             assert len(or_gate_set) == 1
             or_gate = or_gate_set.pop()
-            print(or_gate)
+            progress(or_gate)
             carry = graph[or_gate]
 
         else:
             carry = and_output
             digit_output = xor_output
             assert digit_output == z
-            print(x, y, and_output)
+            progress(x, y, and_output)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
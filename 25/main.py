@@ -96,7 +96,7 @@ def part_1(file_path: str):
             )
         currently_valid_combos = currently_valid_combos.intersection(pin_valid_combos)
 
-    print(len(currently_valid_combos))
+    return len(currently_valid_combos)
 
 
 if __name__ == "__main__":
@@ -108,6 +108,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
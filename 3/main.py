@@ -1,63 +1,51 @@
 import argparse
 import re
 
-import numpy as np
+INSTRUCTION_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+# Longest instruction is mul(123,456), so a shorter tail can hold a partial one
+MAX_INSTRUCTION_LENGTH = len("mul(123,456)")
+CHUNK_SIZE = 1 << 20
 
 
-def read_file(file_path: str) -> list[str]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        text = file.read()
-    pattern = r"mul\(\d{1,3},\d{1,3}\)|do\(\)|don't\(\)"
-    return re.findall(pattern, text)
-
-
-def get_pairs(instructions: list[str]) -> list[tuple[int, int]]:
-    pairs: list[tuple[int, int]] = []
-    for instruction in instructions:
-        if instruction[0] == "m":
-            values_str = instruction[4:-1]
-            pair = tuple(int(x) for x in values_str.split(","))
-            if len(pair) == 2:
-                pairs.append(pair)
-
-    return pairs
-
-
-def multiply_pairs(pairs: list[tuple[int, int]]) -> int:
-    return sum(x[0] * x[1] for x in pairs)
-
-
-def part_1(file_path: str):
-    instructions = read_file(file_path)
-    pairs = get_pairs(instructions)
-    output = multiply_pairs(pairs)
-    print(output)
-
-
-def get_enabled_pairs(instructions: list[str]) -> list[tuple[int, int]]:
-    pairs: list[tuple[int, int]] = []
+def scan_memory(file_path: str, chunk_size: int = CHUNK_SIZE) -> tuple[int, int]:
+    # Returns the sum of every multiplication and of the enabled ones only
+    total = 0
+    enabled_total = 0
     enabled = True
-    for instruction in instructions:
-        if instruction == "do()":
-            enabled = True
-        elif instruction == "don't()":
-            enabled = False
-        else:
-            if enabled:
-                values_str = instruction[4:-1]
-                pair = tuple(int(x) for x in values_str.split(","))
-                if len(pair) == 2:
-                    pairs.append(pair)
+    carry = b""
+    with open(file_path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            buffer = carry + chunk
+            # Instructions starting in the tail may continue in the next chunk
+            limit = len(buffer) - (MAX_INSTRUCTION_LENGTH - 1) if chunk else len(buffer)
+            limit = max(limit, 0)
+            for match in INSTRUCTION_PATTERN.finditer(buffer):
+                if match.start() >= limit:
+                    break
+
+                if match.group(1) is not None:
+                    product = int(match.group(1)) * int(match.group(2))
+                    total += product
+                    if enabled:
+                        enabled_total += product
+                else:
+                    enabled = match.group() == b"do()"
+
+            if not chunk:
+                return total, enabled_total
+
+            carry = buffer[limit:]
 
-    return pairs
 
+def part_1(file_path: str):
+    output, _ = scan_memory(file_path)
+    return output
 
 
 def part_2(file_path: str):
-    instructions = read_file(file_path)
-    pairs = get_enabled_pairs(instructions)
-    output = multiply_pairs(pairs)
-    print(output)
+    _, output = scan_memory(file_path)
+    return output
 
 
 if __name__ == "__main__":
@@ -69,6 +57,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
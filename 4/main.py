@@ -1,96 +1,196 @@
 import argparse
-import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator
 
 import numpy as np
 
-CHAR_TO_INT = {"X": 1, "M": 2, "A": 3, "S": 4}
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from common.grid import Grid
 
-def read_file(file_path: str) -> list[str]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+# A stencil is a set of (row offset, column offset, character) cells
+Stencil = tuple[tuple[int, int, str], ...]
 
-    matrix = []
-    for line in lines:
-        matrix.append([CHAR_TO_INT[x] for x in line.strip()])
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+WILDCARD = "."
 
-    return np.array(matrix)
 
+def read_file(file_path: str) -> np.ndarray:
+    return Grid.from_file(file_path).cells
 
-def find_num_matches(game_matrix: np.ndarray) -> int:
-    num_matches = 0
-    num_rows, num_cols = game_matrix.shape
-    ascending = np.array([1, 2, 3, 4])
-    descending = ascending[::-1]
-    for row in range(num_rows):
-        for col in range(num_cols - 3):
-            selection = game_matrix[row, col : col + 4]
-            if (selection == ascending).all() or (selection == descending).all():
-                num_matches += 1
 
-    for row in range(num_rows - 3):
-        for col in range(num_cols):
-            selection = game_matrix[row : row + 4, col]
-            if (selection == ascending).all() or (selection == descending).all():
-                num_matches += 1
+def normalize_stencil(cells: Iterable[tuple[int, int, str]]) -> Stencil:
+    # Translating to the top left corner lets symmetric stencils compare equal
+    cells = list(cells)
+    min_row = min(d_row for d_row, _, _ in cells)
+    min_col = min(d_col for _, d_col, _ in cells)
+    return tuple(
+        sorted((d_row - min_row, d_col - min_col, char) for d_row, d_col, char in cells)
+    )
 
-    for row in range(num_rows - 3):
-        for col in range(num_cols - 3):
-            selection = game_matrix[row : row + 4, col : col + 4]
-            regular_diag = selection.diagonal()
-            anti_diag = np.fliplr(selection).diagonal()
-            if (regular_diag == ascending).all() or (regular_diag == descending).all():
-                num_matches += 1
 
-            if (anti_diag == ascending).all() or (anti_diag == descending).all():
-                num_matches += 1
+def stencil_from_lines(lines: list[str]) -> Stencil:
+    return normalize_stencil(
+        (row, col, char)
+        for row, line in enumerate(lines)
+        for col, char in enumerate(line)
+        if char != WILDCARD
+    )
 
-    return num_matches
 
+def word_stencils(word: str) -> set[Stencil]:
+    return {
+        normalize_stencil((i * d_row, i * d_col, char) for i, char in enumerate(word))
+        for d_row, d_col in DIRECTIONS
+    }
 
-def part_1(file_path: str):
-    game_matrix = read_file(file_path)
-    output = find_num_matches(game_matrix)
-    print(output)
 
+def cross_stencils(word: str) -> set[Stencil]:
+    # Two copies of the word crossing diagonally at their middle character
+    assert len(word) % 2 == 1
+    middle = len(word) // 2
+    stencils: set[Stencil] = set()
+    for down in [word, word[::-1]]:
+        for up in [word, word[::-1]]:
+            cells = {(i - middle, i - middle, char) for i, char in enumerate(down)}
+            cells |= {(middle - i, i - middle, char) for i, char in enumerate(up)}
+            stencils.add(normalize_stencil(cells))
 
-def get_xs(game_matrix: np.ndarray) -> int:
-    num_matches = 0
-    num_rows, num_cols = game_matrix.shape
-    ascending = np.array([2, 3, 4])
-    descending = ascending[::-1]
+    return stencils
 
-    for row in range(num_rows - 2):
-        for col in range(num_cols - 2):
-            selection = game_matrix[row : row + 3, col : col + 3]
-            regular_diag = selection.diagonal()
-            anti_diag = np.fliplr(selection).diagonal()
-            if (
-                ((regular_diag == ascending).all()
-                or (regular_diag == descending).all())
-                and ((anti_diag == ascending).all()
-                or (anti_diag == descending).all())
-            ):
-                num_matches += 1
 
-    return num_matches
+def count_stencil(grid: np.ndarray, stencil: Stencil) -> int:
+    num_rows, num_cols = grid.shape
+    height = max(d_row for d_row, _, _ in stencil) + 1
+    width = max(d_col for _, d_col, _ in stencil) + 1
+    if height > num_rows or width > num_cols:
+        return 0
+
+    # matches[row, col] is set when the stencil fits with its corner at (row, col)
+    matches = np.ones((num_rows - height + 1, num_cols - width + 1), dtype=bool)
+    for d_row, d_col, char in stencil:
+        view = grid[d_row : d_row + matches.shape[0], d_col : d_col + matches.shape[1]]
+        matches &= view == ord(char)
 
+    return int(matches.sum())
 
-def part_2(file_path: str):
-    game_matrix = read_file(file_path)
-    output = get_xs(game_matrix)
-    print(output)
+
+def count_stencils(grid: np.ndarray, stencils: Iterable[Stencil]) -> int:
+    return sum(count_stencil(grid, stencil) for stencil in stencils)
+
+
+def part_1(file_path: str, words: Iterable[str] = ("XMAS",)):
+    grid = read_file(file_path)
+    stencils = set().union(*(word_stencils(word) for word in words))
+    output = count_stencils(grid, stencils)
+    return output
+
+
+class WordAutomaton:
+    # Aho-Corasick automaton that reports every word occurrence in one pass
+    def __init__(self, patterns: Iterable[bytes]):
+        self.patterns = list(dict.fromkeys(patterns))
+        self.goto: list[dict[int, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[list[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+
+                state = self.goto[state][char]
+
+            self.output[state].append(index)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def count(self, line: bytes, counts: list[int]):
+        state = 0
+        for char in line:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+
+            state = self.goto[state].get(char, 0)
+            for index in self.output[state]:
+                counts[index] += 1
+
+
+def grid_lines(grid: np.ndarray) -> Iterator[tuple[int, bytes]]:
+    # Every row, column, diagonal and anti-diagonal, tagged with its axis
+    num_rows, num_cols = grid.shape
+    for row in grid:
+        yield 0, row.tobytes()
+
+    for col in grid.T:
+        yield 1, col.tobytes()
+
+    for offset in range(1 - num_rows, num_cols):
+        yield 2, grid.diagonal(offset).tobytes()
+        yield 3, np.fliplr(grid).diagonal(offset).tobytes()
+
+
+def count_words(file_path: str, words: Iterable[str]) -> dict[str, int]:
+    # Reversed words are added as patterns so that each line is scanned forwards
+    # only, and single characters are only counted along the rows
+    words = list(dict.fromkeys(words))
+    automaton = WordAutomaton(
+        pattern for word in words for pattern in [word.encode(), word[::-1].encode()]
+    )
+    pattern_indices = {pattern: i for i, pattern in enumerate(automaton.patterns)}
+    line_counts = [0] * len(automaton.patterns)
+    row_counts = [0] * len(automaton.patterns)
+    for axis, line in grid_lines(read_file(file_path)):
+        automaton.count(line, row_counts if axis == 0 else line_counts)
+
+    word_counts: dict[str, int] = {}
+    for word in words:
+        indices = {pattern_indices[word.encode()], pattern_indices[word[::-1].encode()]}
+        word_counts[word] = sum(row_counts[i] for i in indices)
+        if len(word) > 1:
+            word_counts[word] += sum(line_counts[i] for i in indices)
+
+    return word_counts
+
+
+def part_2(file_path: str, word: str = "MAS"):
+    grid = read_file(file_path)
+    output = count_stencils(grid, cross_stencils(word))
+    return output
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-w", "--words", type=str, nargs="+", default=None)
+    # Count each word separately with a single scan over the grid
+    parser.add_argument("-a", "--aho-corasick", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
 
-    if results.part == 1:
-        part_1(results.file_path)
+    if results.part == 1 and results.aho_corasick:
+        word_counts = count_words(results.file_path, results.words or ["XMAS"])
+        for word, count in word_counts.items():
+            print(f"{word}: {count}")
+    elif results.part == 1:
+        print(part_1(results.file_path, results.words or ["XMAS"]))
     else:
-        part_2(results.file_path)
+        assert results.words is None or len(results.words) == 1
+        print(part_2(results.file_path, (results.words or ["MAS"])[0]))
@@ -1,5 +1,9 @@
 import argparse
-from functools import cmp_to_key
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import numpy as np
 
 
 def read_file(file_path: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
@@ -23,124 +27,199 @@ def read_file(file_path: str) -> tuple[list[tuple[int, int]], list[list[int]]]:
     return relations, orders
 
 
-def create_relation_graph(relations: list[tuple[int, int]]) -> dict[int, list[int]]:
-    graph: dict[int, list[int]] = {}
-
-    for edge in relations:
-        start, end = edge
-        if start in graph:
-            if end not in graph[start]:
-                graph[start].append(end)
-        else:
-            graph[start] = [end]
-
-        if end not in graph:
-            graph[end] = []
-
-    return graph
-
-
-def get_followers(graph: dict[int, list[int]]) -> dict[int, list[int]]:
-    followers: dict[int, list[int]] = {}
+def iter_bits(bitset: int) -> Iterator[int]:
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+@dataclass
+class RelationIndex:
+    # Pages get dense ids, and the direct "must precede" rules are stored as
+    # integer bitsets over those ids in both directions
+    ids: dict[int, int] = field(default_factory=dict)
+    pages: list[int] = field(default_factory=list)
+    followers: list[int] = field(default_factory=list)
+    predecessors: list[int] = field(default_factory=list)
+    orderings: dict[frozenset[int], Optional[list[int]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_relations(cls, relations: list[tuple[int, int]]) -> "RelationIndex":
+        index = cls()
+        for start, end in relations:
+            start_id, end_id = index.page_id(start), index.page_id(end)
+            index.followers[start_id] |= 1 << end_id
+            index.predecessors[end_id] |= 1 << start_id
+
+        return index
+
+    def page_id(self, page: int) -> int:
+        if page not in self.ids:
+            self.ids[page] = len(self.pages)
+            self.pages.append(page)
+            self.followers.append(0)
+            self.predecessors.append(0)
+
+        return self.ids[page]
+
+    def precedes(self, start: int, end: int) -> bool:
+        start_id, end_id = self.ids.get(start), self.ids.get(end)
+        if start_id is None or end_id is None:
+            return False
+
+        return bool(self.followers[start_id] >> end_id & 1)
+
+    def is_valid(self, order: list[int]) -> bool:
+        # Invalid when a page has a rule to precede one that came before it.
+        # Pages missing from the index have no rules and cannot conflict.
+        seen = 0
+        for page in order:
+            page_id = self.ids.get(page)
+            if page_id is None:
+                continue
 
-    def get_followers_helper(
-        vertex: int, graph: dict[int, list[int]], followers: dict[int, list[int]]
-    ):
-        # Already visited
-        if vertex in followers:
-            return
+            if self.followers[page_id] & seen:
+                return False
+
+            seen |= 1 << page_id
+
+        return True
+
+    def sort_pages(self, order: list[int]) -> list[int]:
+        # Topological sort over the rules between the pages of this update only,
+        # keeping repeated pages together. Pages on a cycle are left out.
+        counts = Counter(order)
+        mask = sum(1 << self.ids[page] for page in counts if page in self.ids)
+        in_degrees = {
+            page: (self.predecessors[self.ids[page]] & mask).bit_count()
+            if page in self.ids
+            else 0
+            for page in counts
+        }
+        ready = deque(page for page in counts if in_degrees[page] == 0)
+        fixed: list[int] = []
+        while ready:
+            page = ready.popleft()
+            fixed += [page] * counts[page]
+            if page not in self.ids:
+                continue
 
-        # No neighbors
-        if not graph[vertex]:
-            followers[vertex] = []
-            return
+            for follower_id in iter_bits(self.followers[self.ids[page]] & mask):
+                follower = self.pages[follower_id]
+                in_degrees[follower] -= 1
+                if in_degrees[follower] == 0:
+                    ready.append(follower)
 
-        # Followers are neighbors and their followers
-        followers[vertex] = graph[vertex].copy()
-        for neighbor in graph[vertex]:
-            get_followers_helper(neighbor, graph, followers)
-            followers[vertex] += followers[neighbor]
+        return fixed
 
-        followers[vertex] = list(set(followers[vertex]))
+    def fix(self, order: list[int]) -> list[int]:
+        fixed = self.sort_pages(order)
+        assert len(fixed) == len(order), "rules between the pages form a cycle"
+        return fixed
 
-    for vertex in graph:
-        get_followers_helper(vertex, graph, followers)
+    def ordering(self, pages: frozenset[int]) -> Optional[list[int]]:
+        # The only valid order of a page set, or None when the rules between the
+        # pages allow several or none and ranks alone cannot validate an update
+        if pages not in self.orderings:
+            fixed = self.sort_pages(sorted(pages))
+            adjacent = zip(fixed, fixed[1:])
+            unique = len(fixed) == len(pages) and all(
+                self.precedes(start, end) for start, end in adjacent
+            )
+            self.orderings[pages] = fixed if unique else None
 
-    return followers
+        return self.orderings[pages]
 
 
-def sum_middles_of_valid_orders(
-    orders: list[list[int]], followers: dict[int, list[int]]
-) -> int:
+def sum_middles_of_valid_orders(orders: list[list[int]], index: RelationIndex) -> int:
     running_sum = 0
     for order in orders:
-        valid = True
-        for index, preceding_page in enumerate(order):
-            for following_page in order[index + 1 :]:
-                if preceding_page in followers[following_page]:
-                    valid = False
-                    break
-            if not valid:
-                break
-
-        if valid:
+        if index.is_valid(order):
             middle = len(order) // 2
             running_sum += order[middle]
 
     return running_sum
 
 
-def part_1(file_path: str):
+def part_1(file_path: str, batch: bool = False):
     relations, orders = read_file(file_path)
-    graph = create_relation_graph(relations)
-    output = sum_middles_of_valid_orders(orders, graph)
-    print(output)
-
+    index = RelationIndex.from_relations(relations)
+    if batch:
+        return sum_middles_batched(orders, index, fix=False)
 
-def sum_middles_of_fixed_orders(
-    orders: list[list[int]], followers: dict[int, list[int]]
-) -> int:
-    def comparison(a, b):
-        if b in followers[a]:
-            return -1
+    output = sum_middles_of_valid_orders(orders, index)
+    return output
 
-        return 1
 
+def sum_middles_of_fixed_orders(orders: list[list[int]], index: RelationIndex) -> int:
     running_sum = 0
     for order in orders:
-        valid = True
-        for index, preceding_page in enumerate(order):
-            for following_page in order[index + 1 :]:
-                if preceding_page in followers[following_page]:
-                    valid = False
-                    break
-            if not valid:
-                break
-
-        if not valid:
-            fixed = sorted(order, key=cmp_to_key(comparison))
+        if not index.is_valid(order):
+            fixed = index.fix(order)
             middle = len(order) // 2
             running_sum += fixed[middle]
 
     return running_sum
 
 
-def part_2(file_path: str):
+def sum_middles_batched(
+    orders: list[list[int]], index: RelationIndex, fix: bool
+) -> int:
+    # Updates sharing a page set and length are validated and fixed together
+    # from one rank array, returning the sum for fixed updates when fix is set
+    # and for valid ones otherwise
+    groups: dict[tuple[frozenset[int], int], list[list[int]]] = defaultdict(list)
+    for order in orders:
+        groups[(frozenset(order), len(order))].append(order)
+
+    running_sum = 0
+    for (pages, length), group_orders in groups.items():
+        ordering = index.ordering(pages)
+        # Updates repeating a page have no unique order to rank against
+        if ordering is None or len(ordering) != length:
+            if fix:
+                running_sum += sum_middles_of_fixed_orders(group_orders, index)
+            else:
+                running_sum += sum_middles_of_valid_orders(group_orders, index)
+            continue
+
+        group = np.array(group_orders)
+        sorted_pages = np.sort(np.array(ordering))
+        page_ranks = np.argsort(np.array(ordering))
+        ranks = page_ranks[np.searchsorted(sorted_pages, group)]
+        valid = (np.diff(ranks, axis=1) > 0).all(axis=1)
+        middle = group.shape[1] // 2
+        if fix:
+            fixed = np.take_along_axis(group, np.argsort(ranks, axis=1), axis=1)
+            running_sum += int(fixed[~valid, middle].sum())
+        else:
+            running_sum += int(group[valid, middle].sum())
+
+    return running_sum
+
+
+def part_2(file_path: str, batch: bool = False):
     relations, orders = read_file(file_path)
-    graph = create_relation_graph(relations)
-    output = sum_middles_of_fixed_orders(orders, graph)
-    print(output)
+    index = RelationIndex.from_relations(relations)
+    if batch:
+        return sum_middles_batched(orders, index, fix=True)
+
+    output = sum_middles_of_fixed_orders(orders, index)
+    return output
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    # Validate and fix updates in groups that share the same set of pages
+    parser.add_argument("-b", "--batch", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path, results.batch))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path, results.batch))
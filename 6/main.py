@@ -1,9 +1,17 @@
 import argparse
-from collections import defaultdict
-from copy import deepcopy
-from itertools import product
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
-from typing import Self
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator, Self
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.grid import Grid
+from common.progress import is_verbose, progress, set_verbose
 
 
 class Direction(Enum):
@@ -20,38 +28,138 @@ class Direction(Enum):
 def read_file(
     file_path: str,
 ) -> tuple[list[tuple[int, int]], tuple[int, int], tuple[int, int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-
-    obstacles = []
-    starting_pos = None
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line.strip()):
-            if char == "#":
-                obstacles.append((row, col))
-            if char == "^":
-                assert not starting_pos
-                starting_pos = (row, col)
-
-    assert starting_pos
-    return obstacles, starting_pos, (len(lines), len(lines[0].strip()))
-
+    grid = Grid.from_file(file_path)
+    obstacles = [(row, col) for row, col in grid.find("#").tolist()]
+    starting_pos = grid.find_one("^")
+    return obstacles, starting_pos, grid.shape
+
+
+class JumpTable:
+    # stops[direction][cell] is the flat index of the last cell the guard reaches
+    # before the next obstacle, or its bitwise complement when the guard walks
+    # off the board from there instead
+    def __init__(self, obstacles: list[tuple[int, int]], board_size: tuple[int, int]):
+        self.board_size = board_size
+        num_rows, num_cols = board_size
+        self.row_obstacles: list[list[int]] = [[] for _ in range(num_rows)]
+        self.col_obstacles: list[list[int]] = [[] for _ in range(num_cols)]
+        for row, col in sorted(obstacles):
+            self.row_obstacles[row].append(col)
+            self.col_obstacles[col].append(row)
+
+        for rows in self.col_obstacles:
+            rows.sort()
+
+        self.stops = [[0] * (num_rows * num_cols) for _ in Direction]
+        # Entries replaced by trial obstacles, as (direction, cell, old stop)
+        self.overlay: list[tuple[int, int, int]] = []
+        for row in range(num_rows):
+            cols = [-1] + self.row_obstacles[row] + [num_cols]
+            for left, right in zip(cols, cols[1:]):
+                self.fill_span(False, row, left + 1, right - 1)
+
+        for col in range(num_cols):
+            rows = [-1] + self.col_obstacles[col] + [num_rows]
+            for top, bottom in zip(rows, rows[1:]):
+                self.fill_span(True, col, top + 1, bottom - 1)
+
+    def fill_span(self, vertical: bool, line: int, start: int, end: int):
+        # Point every cell of an obstacle-free span of a row or column at its ends
+        num_rows, num_cols = self.board_size
+        if start > end:
+            return
+
+        if vertical:
+            first, last = start * num_cols + line, end * num_cols + line
+            step, backward, forward = num_cols, Direction.UP, Direction.DOWN
+            line_length = num_rows
+        else:
+            first, last = line * num_cols + start, line * num_cols + end
+            step, backward, forward = 1, Direction.LEFT, Direction.RIGHT
+            line_length = num_cols
+
+        backward_stop = ~first if start == 0 else first
+        forward_stop = ~last if end == line_length - 1 else last
+        for flat in range(first, last + 1, step):
+            self.stops[backward.value][flat] = backward_stop
+            self.stops[forward.value][flat] = forward_stop
+
+    def next_stop(
+        self, pos: tuple[int, int], direction: Direction
+    ) -> tuple[tuple[int, int], bool]:
+        # The last cell reached before turning, and whether the guard walks off
+        # the board from there instead
+        num_cols = self.board_size[1]
+        stop = self.stops[direction.value][pos[0] * num_cols + pos[1]]
+        if stop < 0:
+            return divmod(~stop, num_cols), True
+
+        return divmod(stop, num_cols), False
+
+    def patch(self, direction: Direction, cells: range, stop: int):
+        stops = self.stops[direction.value]
+        for flat in cells:
+            self.overlay.append((direction.value, flat, stops[flat]))
+            stops[flat] = stop
+
+    @contextmanager
+    def trial_obstacle(self, pos: tuple[int, int]) -> Iterator[None]:
+        # Only the cells between the new obstacle and the next ones in its row
+        # and column stop differently, so just those entries are overlaid
+        row, col = pos
+        num_rows, num_cols = self.board_size
+        flat = row * num_cols + col
+
+        cols = self.row_obstacles[row]
+        index = bisect_left(cols, col)
+        left = cols[index - 1] if index > 0 else -1
+        right = cols[index] if index < len(cols) else num_cols
+        before = range(flat - col + left + 1, flat)
+        after = range(flat + 1, flat - col + right)
+        self.patch(Direction.RIGHT, before, flat - 1)
+        self.patch(Direction.LEFT, after, flat + 1)
+
+        rows = self.col_obstacles[col]
+        index = bisect_left(rows, row)
+        top = rows[index - 1] if index > 0 else -1
+        bottom = rows[index] if index < len(rows) else num_rows
+        above = range((top + 1) * num_cols + col, flat, num_cols)
+        below = range(flat + num_cols, bottom * num_cols + col, num_cols)
+        self.patch(Direction.DOWN, above, flat - num_cols)
+        self.patch(Direction.UP, below, flat + num_cols)
+
+        try:
+            yield
+        finally:
+            while self.overlay:
+                direction, flat, stop = self.overlay.pop()
+                self.stops[direction][flat] = stop
+
+
+def get_segment(start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+    # Cells from start to end inclusive along a row or a column
+    d_row = (end[0] > start[0]) - (end[0] < start[0])
+    d_col = (end[1] > start[1]) - (end[1] < start[1])
+    length = abs(end[0] - start[0]) + abs(end[1] - start[1])
+    return [(start[0] + i * d_row, start[1] + i * d_col) for i in range(length + 1)]
 
-def get_next_pos(pos: tuple[int, int], direction: Direction) -> tuple[int, int]:
-    if direction == Direction.UP:
-        return (pos[0] - 1, pos[1])
 
-    if direction == Direction.RIGHT:
-        return (pos[0], pos[1] + 1)
-
-    if direction == Direction.DOWN:
-        return (pos[0] + 1, pos[1])
-
-    return (pos[0], pos[1] - 1)
+def get_path(
+    table: JumpTable, starting_pos: tuple[int, int]
+) -> list[tuple[tuple[int, int], Direction]]:
+    current_pos = starting_pos
+    current_direction = Direction.UP
+    visited: list[tuple[tuple[int, int], Direction]] = []
+    while True:
+        next_pos, leaves = table.next_stop(current_pos, current_direction)
+        for pos in get_segment(current_pos, next_pos):
+            visited.append((pos, current_direction))
 
+        if leaves:
+            return visited
 
-def pos_on_board(pos: tuple[int, int], board_size: tuple[int, int]):
-    return 0 <= pos[0] < board_size[0] and 0 <= pos[1] < board_size[1]
+        current_pos = next_pos
+        current_direction = Direction.turn(current_direction)
 
 
 def get_num_visited(
@@ -59,106 +167,118 @@ def get_num_visited(
     starting_pos: tuple[int, int],
     board_size: tuple[int, int],
 ) -> int:
-
-    current_pos = starting_pos
-    current_direction = Direction.UP
-    visited: set[tuple[int, int]] = set()
-    on_board = True
-    while on_board:
-        visited.add(current_pos)
-        maybe_next_pos = get_next_pos(current_pos, current_direction)
-        while maybe_next_pos in obstacles:
-            current_direction = Direction.turn(current_direction)
-            maybe_next_pos = get_next_pos(current_pos, current_direction)
-        next_pos = maybe_next_pos
-        on_board = pos_on_board(next_pos, board_size)
-        current_pos = next_pos
-
-    return len(visited)
+    table = JumpTable(obstacles, board_size)
+    return len({pos for pos, _ in get_path(table, starting_pos)})
 
 
 def part_1(file_path: str):
     obstacles, starting_pos, board_size = read_file(file_path)
     output = get_num_visited(obstacles, starting_pos, board_size)
-    print(output)
+    return output
 
 
-def get_path(
-    obstacles: list[tuple[int, int]],
-    starting_pos: tuple[int, int],
-    board_size: tuple[int, int],
-) -> list[tuple[tuple[int, int], Direction]]:
+# A candidate obstacle with the position and direction the guard has just
+# before first walking into it
+Trial = tuple[tuple[int, int], tuple[int, int], Direction]
 
-    current_pos = starting_pos
-    current_direction = Direction.UP
-    visited: list[tuple[tuple[int, int], Direction]] = []
-    on_board = True
-    while on_board:
-        visited.append((current_pos, current_direction))
-        maybe_next_pos = get_next_pos(current_pos, current_direction)
-        while maybe_next_pos in obstacles:
-            current_direction = Direction.turn(current_direction)
-            visited.append((current_pos, current_direction))
-            maybe_next_pos = get_next_pos(current_pos, current_direction)
-        next_pos = maybe_next_pos
-        on_board = pos_on_board(next_pos, board_size)
-        current_pos = next_pos
 
-    return visited
+def get_trials(table: JumpTable, starting_pos: tuple[int, int]) -> list[Trial]:
+    # Only cells on the original path can change the guard's route
+    path = get_path(table, starting_pos)
+    seen = {starting_pos}
+    trials: list[Trial] = []
+    for (previous_pos, _), (pos, direction) in zip(path, path[1:]):
+        if pos not in seen:
+            seen.add(pos)
+            trials.append((pos, previous_pos, direction))
 
+    return trials
 
-def get_num_loops(
-    obstacles: list[tuple[int, int]],
-    starting_pos: tuple[int, int],
-    board_size: tuple[int, int],
-) -> int:
 
-    loop_obstacles = []
-    for row, col in product(range(board_size[0]), range(board_size[1])):
-        print(row, col)
-        current_pos = starting_pos
-        current_direction = Direction.UP
-        visited: dict[tuple[int, int], list[Direction]] = defaultdict(list)
-        new_obstacle = (row, col)
-        obstacles.append(new_obstacle)
-        first_iter = True
-        while pos_on_board(current_pos, board_size):
-            if current_pos in visited and current_direction in visited[current_pos] and not first_iter:
-                loop_obstacles.append(new_obstacle)
-                break
+def is_loop(
+    table: JumpTable, pos: tuple[int, int], direction: Direction, visits: bytearray
+) -> bool:
+    # Only the turns are recorded, since a loop has to repeat one of them, and
+    # visits is left cleared for the next trial
+    stops = table.stops
+    flat = pos[0] * table.board_size[1] + pos[1]
+    direction_value = direction.value
+    touched: list[int] = []
+    looped = False
+    while True:
+        flat = stops[direction_value][flat]
+        if flat < 0:
+            break
+
+        index = flat * 4 + direction_value
+        if visits[index]:
+            looped = True
+            break
 
-            # Add current_pos and current_direction to visited
-            visited[current_pos].append(current_direction)
+        visits[index] = 1
+        touched.append(index)
+        direction_value = (direction_value + 1) % 4
 
-            maybe_next_pos = get_next_pos(current_pos, current_direction)
-            if maybe_next_pos in obstacles:
-                current_direction = Direction.turn(current_direction)
-            else:
-                current_pos = maybe_next_pos
+    for index in touched:
+        visits[index] = 0
 
-            if first_iter:
-                first_iter = False
+    return looped
 
-        obstacles.remove(new_obstacle)
 
-    return len(loop_obstacles)
+def count_loops(
+    obstacles: list[tuple[int, int]], board_size: tuple[int, int], trials: list[Trial]
+) -> int:
+    table = JumpTable(obstacles, board_size)
+    visits = bytearray(board_size[0] * board_size[1] * 4)
+    num_loops = 0
+    for obstacle, pos, direction in trials:
+        progress(obstacle)
+        with table.trial_obstacle(obstacle):
+            if is_loop(table, pos, direction, visits):
+                num_loops += 1
+
+    return num_loops
 
 
-def part_2(file_path: str):
+def get_num_loops(
+    obstacles: list[tuple[int, int]],
+    starting_pos: tuple[int, int],
+    board_size: tuple[int, int],
+    workers: int = 1,
+) -> int:
+    trials = get_trials(JumpTable(obstacles, board_size), starting_pos)
+    if workers == 1:
+        return count_loops(obstacles, board_size, trials)
+
+    # Interleaved chunks spread the long and short walks evenly over the workers
+    num_chunks = workers * 4
+    chunks = [trials[i::num_chunks] for i in range(num_chunks)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_verbose, initargs=(is_verbose(),)
+    ) as executor:
+        return sum(
+            executor.map(count_loops, repeat(obstacles), repeat(board_size), chunks)
+        )
+
+
+def part_2(file_path: str, workers: int = 1):
     obstacles, starting_pos, board_size = read_file(file_path)
-    output = get_num_loops(obstacles, starting_pos, board_size)
-    print(output)
+    output = get_num_loops(obstacles, starting_pos, board_size, workers)
+    return output
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int, default=1)
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    set_verbose(results.verbose)
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path, results.jobs))
@@ -1,103 +1,206 @@
 import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Union
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.inputs import int_rows
 
 
 def read_file(
     file_path: str,
 ) -> list[tuple[int, list[int]]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
+    numbers, row_lengths = int_rows(file_path)
+    rows = np.split(numbers, np.cumsum(row_lengths)[:-1])
 
     values: list[tuple[int, list[int]]] = []
-    for line in lines:
-        split_line = line.split(":")
-        solution = int(split_line[0])
-        sequence_str = split_line[1].strip()
-        sequence = [int(x) for x in sequence_str.split()]
-
+    for row in rows:
+        # The solution comes before the colon, followed by the sequence
+        solution, *sequence = row.tolist()
         values.append((solution, sequence))
 
     return values
 
 
-def sum_valid_equations(values: list[tuple[int, list[int]]]) -> int:
-    running_sum = 0
-    for solution, sequence in values:
-        possible_combinations = 2 ** (len(sequence) - 1)
-        for i in range(possible_combinations):
-            maybe_solution = sequence[0]
-            operators = f"{i:0{len(sequence)-1}b}"
-            for j, operator in enumerate(operators):
-                # plus
-                if operator == '0':
-                    maybe_solution += sequence[j + 1]
-                else:
-                    maybe_solution *= sequence[j + 1]
+# Returned by an inverse when every prefix gives the result, as with x * 0 == 0
+ANY_PREFIX = object()
+Prefix = Union[int, None, object]
+
+
+@dataclass(frozen=True)
+class Operator:
+    name: str
+    # forward(prefix, operand) applies the operator, and inverse(result, operand)
+    # returns the prefix that would give result, None when there is none, or
+    # ANY_PREFIX when every prefix does
+    forward: Callable[[int, int], int]
+    inverse: Callable[[int, int], Prefix]
+    # Set when a positive operand never shrinks a non-negative prefix
+    monotone: bool = False
+
+
+def get_suffix_power(operand: int) -> int:
+    # Smallest power of ten above the operand, the shift used by concatenation
+    power = 10
+    while power <= operand:
+        power *= 10
+
+    return power
+
+
+def add(prefix: int, operand: int) -> int:
+    return prefix + operand
+
+
+def subtract(result: int, operand: int) -> Prefix:
+    return result - operand if result >= operand else None
+
+
+def multiply(prefix: int, operand: int) -> int:
+    return prefix * operand
+
+
+def divide(result: int, operand: int) -> Prefix:
+    if operand == 0:
+        return ANY_PREFIX if result == 0 else None
+
+    return result // operand if result % operand == 0 else None
+
+
+def concatenate(prefix: int, operand: int) -> int:
+    return prefix * get_suffix_power(operand) + operand
 
-            if maybe_solution == solution:
-                running_sum += solution
-                break
 
-    return running_sum
+def strip_suffix(result: int, operand: int) -> Prefix:
+    power = get_suffix_power(operand)
+    if result < operand or (result - operand) % power != 0:
+        return None
 
+    return (result - operand) // power
 
-def part_1(file_path: str):
+
+OPERATORS = {
+    operator.name: operator
+    for operator in [
+        Operator("+", add, subtract, monotone=True),
+        Operator("*", multiply, divide, monotone=True),
+        Operator("||", concatenate, strip_suffix, monotone=True),
+    ]
+}
+PART_OPERATORS = {1: ["+", "*"], 2: ["+", "*", "||"]}
+CHUNK_SIZE = 256
+
+
+def is_solvable(solution: int, sequence: list[int], operators: list[Operator]) -> bool:
+    # Meets in the middle: the values of the first half are evaluated forwards,
+    # with branches sharing their prefixes through the value sets, and the
+    # second half is undone backwards from the solution. Prefixes above the
+    # solution are dropped only when nothing later can shrink them again.
+    split = max(1, len(sequence) // 2)
+    prune = all(operator.monotone for operator in operators) and 0 not in sequence
+    prefixes = {sequence[0]}
+    for operand in sequence[1:split]:
+        prefixes = {
+            operator.forward(prefix, operand)
+            for prefix in prefixes
+            for operator in operators
+        }
+        if prune:
+            prefixes = {prefix for prefix in prefixes if prefix <= solution}
+
+    def solve(target: int, index: int) -> bool:
+        if index < split:
+            return target in prefixes
+
+        operand = sequence[index]
+        for operator in operators:
+            prefix = operator.inverse(target, operand)
+            if prefix is ANY_PREFIX:
+                return True
+
+            if prefix is not None and solve(prefix, index - 1):
+                return True
+
+        return False
+
+    return solve(solution, len(sequence) - 1)
+
+
+def solve_chunk(
+    values: list[tuple[int, list[int]]], operator_names: list[str]
+) -> list[bool]:
+    operators = [OPERATORS[name] for name in operator_names]
+    return [
+        is_solvable(solution, sequence, operators) for solution, sequence in values
+    ]
+
+
+def calibrate(
+    values: list[tuple[int, list[int]]],
+    operator_names: list[str],
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+) -> list[bool]:
+    if workers == 1:
+        return solve_chunk(values, operator_names)
+
+    chunks = [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(solve_chunk, chunks, repeat(operator_names))
+        return [solvable for chunk_results in results for solvable in chunk_results]
+
+
+def sum_valid_equations(
+    values: list[tuple[int, list[int]]], operator_names: list[str], workers: int = 1
+) -> int:
+    solvable = calibrate(values, operator_names, workers)
+    return sum(solution for (solution, _), valid in zip(values, solvable) if valid)
+
+
+def part_1(file_path: str, workers: int = 1):
     values = read_file(file_path)
-    output = sum_valid_equations(values)
-    print(output)
-
-def num_to_ternary(num: int, length: int = 0) -> str:
-    string = ""
-    if num == 0:
-        return "0".zfill(length)
-    if num == 1:
-        return "1".zfill(length)
-    while num >= 1:
-        r = num % 3
-        string = f"{r}{string}"
-        num = num // 3
-
-    return string.zfill(length)
-
-def sum_valid_equations_concat(values: list[tuple[int, list[int]]]) -> int:
-    running_sum = 0
-    for solution, sequence in values:
-        possible_combinations = 3 ** (len(sequence) - 1)
-        for i in range(possible_combinations):
-            maybe_solution = sequence[0]
-            operators = num_to_ternary(i, len(sequence) - 1)
-            for j, operator in enumerate(operators):
-                # plus
-                if operator == '0':
-                    maybe_solution += sequence[j + 1]
-                elif operator == '1':
-                    maybe_solution *= sequence[j + 1]
-                else:
-                    maybe_solution_str = str(maybe_solution)
-                    maybe_solution_str += str(sequence[j+1])
-                    maybe_solution = int(maybe_solution_str)
-
-            if maybe_solution == solution:
-                running_sum += solution
-                break
-
-    return running_sum
-
-
-def part_2(file_path: str):
+    output = sum_valid_equations(values, PART_OPERATORS[1], workers)
+    return output
+
+
+def part_2(file_path: str, workers: int = 1):
     values = read_file(file_path)
-    output = sum_valid_equations_concat(values)
-    print(output)
+    output = sum_valid_equations(values, PART_OPERATORS[2], workers)
+    return output
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+    # Replace the part's operators, e.g. -o + "*" to get part 1
+    parser.add_argument("-o", "--operators", type=str, nargs="+", default=None)
+    # Print whether each line can be solved before the total
+    parser.add_argument("-l", "--lines", action="store_true")
     results = parser.parse_args()
 
     assert results.part in [1, 2]
+    assert results.jobs >= 1
 
-    if results.part == 1:
-        part_1(results.file_path)
+    if results.operators is None and not results.lines:
+        if results.part == 1:
+            print(part_1(results.file_path, results.jobs))
+        else:
+            print(part_2(results.file_path, results.jobs))
     else:
-        part_2(results.file_path)
+        operator_names = results.operators or PART_OPERATORS[results.part]
+        assert all(name in OPERATORS for name in operator_names)
+        values = read_file(results.file_path)
+        solvable = calibrate(values, operator_names, results.jobs)
+        if results.lines:
+            for (solution, sequence), valid in zip(values, solvable):
+                print(f"{solution}: {' '.join(str(x) for x in sequence)} -> {valid}")
+
+        print(sum(solution for (solution, _), valid in zip(values, solvable) if valid))
@@ -1,116 +1,190 @@
 import argparse
+import sys
 from collections import defaultdict
-from itertools import combinations
+from pathlib import Path
 
+import numpy as np
 
-def read_file(
-    file_path: str,
-) -> tuple[dict[str, list[tuple[int, int]]], tuple[int, int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        lines = file.readlines()
-        lines = [line.strip() for line in lines]
+sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-    all_antennae: list[tuple[int, int]] = []
-    antennae_by_freq: dict[str, list[tuple[int, int]]] = defaultdict(list)
-    for row, line in enumerate(lines):
-        for col, char in enumerate(line):
-            if char != ".":
-                all_antennae.append((row, col))
-                antennae_by_freq[char].append((row, col))
+from common.grid import Grid
 
-    return antennae_by_freq, (len(lines), len(lines[0]))
+# Upper bound on the resonant antinodes expanded at once
+MAX_BATCH_POINTS = 1 << 22
 
 
-def add(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
-    result = tuple(a_component + b_component for a_component, b_component in zip(a, b))
-    assert len(result) == 2
-    return result
+def read_file(file_path: str) -> tuple[dict[str, np.ndarray], tuple[int, int]]:
+    grid = Grid.from_file(file_path)
+    positions = np.argwhere(~grid.mask("."))
+    frequencies = grid.cells[positions[:, 0], positions[:, 1]]
+    antennae_by_freq = {
+        chr(frequency): positions[frequencies == frequency]
+        for frequency in np.unique(frequencies).tolist()
+    }
+    return antennae_by_freq, grid.shape
 
 
-def sub(tip: tuple[int, int], tail: tuple[int, int]) -> tuple[int, int]:
-    result = tuple(
-        tip_component - tail_component
-        for tip_component, tail_component in zip(tip, tail)
-    )
-    assert len(result) == 2
-    return result
+def get_pairs(antennae: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Every ordered pair of distinct antennae
+    first, second = np.nonzero(~np.eye(len(antennae), dtype=bool))
+    return antennae[first], antennae[second]
 
 
-def negate(a: tuple[int, int]) -> tuple[int, int]:
-    result = tuple(-x for x in a)
-    assert len(result) == 2
-    return result
-
-
-def on_board(maybe_antinode: tuple[int, int], board_size: tuple[int, int]) -> bool:
-    return (0 <= maybe_antinode[0] < board_size[0]) and (
-        0 <= maybe_antinode[1] < board_size[1]
-    )
+def mark_on_board(occupancy: np.ndarray, points: np.ndarray):
+    on_board = ((points >= 0) & (points < occupancy.shape)).all(axis=1)
+    occupancy[points[on_board, 0], points[on_board, 1]] = True
 
 
 def find_num_antinodes(
-    antennae_by_freq: dict[str, list[tuple[int, int]]],
+    antennae_by_freq: dict[str, np.ndarray],
     board_size: tuple[int, int],
 ) -> int:
-    antinodes: set[tuple[int, int]] = set()
+    occupancy = np.zeros(board_size, dtype=bool)
     for antennae in antennae_by_freq.values():
-        for antenna_1, antenna_2 in combinations(antennae, 2):
-            displacement = sub(antenna_2, antenna_1)
-            maybe_antinode = add(antenna_2, displacement)
-            if on_board(maybe_antinode, board_size):
-                antinodes.add(maybe_antinode)
+        first, second = get_pairs(antennae)
+        mark_on_board(occupancy, 2 * second - first)
 
-            neg_displacement = negate(displacement)
-            maybe_antinode = add(antenna_1, neg_displacement)
-            if on_board(maybe_antinode, board_size):
-                antinodes.add(maybe_antinode)
-
-    return len(antinodes)
+    return int(occupancy.sum())
 
 
 def part_1(file_path: str):
     antennae_by_freq, board_size = read_file(file_path)
-    print(find_num_antinodes(antennae_by_freq, board_size))
+    return find_num_antinodes(antennae_by_freq, board_size)
+
+
+def get_num_steps(
+    starts: np.ndarray, steps: np.ndarray, board_size: tuple[int, int]
+) -> np.ndarray:
+    # How many whole steps each start can take before leaving the board
+    room = np.where(steps > 0, np.subtract(board_size, 1) - starts, starts)
+    limits = np.where(steps != 0, room // np.maximum(np.abs(steps), 1), max(board_size))
+    return limits.min(axis=1)
 
 
 def find_num_resonant_antinodes(
-    antennae_by_freq: dict[str, list[tuple[int, int]]],
+    antennae_by_freq: dict[str, np.ndarray],
     board_size: tuple[int, int],
 ) -> int:
-    antinodes: set[tuple[int, int]] = set()
+    occupancy = np.zeros(board_size, dtype=bool)
     for antennae in antennae_by_freq.values():
-        for antenna_1, antenna_2 in combinations(antennae, 2):
-            antinodes.add(antenna_1)
-            antinodes.add(antenna_2)
-            displacement = sub(antenna_2, antenna_1)
-            maybe_antinode = add(antenna_2, displacement)
-            while on_board(maybe_antinode, board_size):
-                antinodes.add(maybe_antinode)
-                maybe_antinode = add(maybe_antinode, displacement)
-
-            neg_displacement = negate(displacement)
-            maybe_antinode = add(antenna_1, neg_displacement)
-            while on_board(maybe_antinode, board_size):
-                antinodes.add(maybe_antinode)
-                maybe_antinode = add(maybe_antinode, neg_displacement)
-
-    return len(antinodes)
+        # Walk from the first antenna through the second to the edge of the
+        # board, in steps that hit every grid point on the line
+        first, second = get_pairs(antennae)
+        displacement = second - first
+        steps = displacement // np.gcd(displacement[:, 0], displacement[:, 1])[:, None]
+        counts = get_num_steps(first, steps, board_size) + 1
+        # Pairs are expanded in batches to bound the size of the point arrays
+        ends = np.cumsum(counts)
+        start = 0
+        while start < len(counts):
+            limit = ends[start] - counts[start] + MAX_BATCH_POINTS
+            end = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+            batch_counts = counts[start:end]
+            pair_indices = np.repeat(np.arange(start, end), batch_counts)
+            offsets = np.repeat(np.cumsum(batch_counts) - batch_counts, batch_counts)
+            multiples = np.arange(batch_counts.sum()) - offsets
+            points = first[pair_indices] + multiples[:, None] * steps[pair_indices]
+            occupancy[points[:, 0], points[:, 1]] = True
+            start = end
+
+    return int(occupancy.sum())
+
+
+def get_line(
+    antenna: np.ndarray, other: np.ndarray, board_size: tuple[int, int]
+) -> np.ndarray:
+    # Every grid point on the board along the line through both antennae
+    displacement = other - antenna
+    step = displacement // np.gcd(*displacement)
+    starts = antenna[None, :]
+    num_backward = get_num_steps(starts, -step[None, :], board_size)[0]
+    num_forward = get_num_steps(starts, step[None, :], board_size)[0]
+    return antenna + np.arange(-num_backward, num_forward + 1)[:, None] * step
+
+
+class AntinodeIndex:
+    # Each cell counts the antenna pairs that make it an antinode, so single
+    # antennae can be added or removed without recomputing the whole map
+    def __init__(self, board_size: tuple[int, int]):
+        self.board_size = board_size
+        self.antennae_by_freq: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self.counts = np.zeros(board_size, dtype=np.int32)
+        self.resonant_counts = np.zeros(board_size, dtype=np.int32)
+        self.num_antinodes = 0
+        self.num_resonant_antinodes = 0
+
+    @classmethod
+    def from_antennae(
+        cls, antennae_by_freq: dict[str, np.ndarray], board_size: tuple[int, int]
+    ) -> "AntinodeIndex":
+        index = cls(board_size)
+        for frequency, antennae in antennae_by_freq.items():
+            for row, col in antennae.tolist():
+                index.add_antenna((row, col), frequency)
+
+        return index
+
+    def update_counts(self, counts: np.ndarray, points: np.ndarray, delta: int) -> int:
+        # Returns the change in the number of antinodes, points must be distinct
+        points = points[((points >= 0) & (points < counts.shape)).all(axis=1)]
+        rows, cols = points[:, 0], points[:, 1]
+        num_before = np.count_nonzero(counts[rows, cols])
+        counts[rows, cols] += delta
+        return np.count_nonzero(counts[rows, cols]) - num_before
+
+    def update_pairs(self, antenna: tuple[int, int], frequency: str, delta: int):
+        position = np.array(antenna)
+        for other in np.array(self.antennae_by_freq[frequency]).reshape(-1, 2):
+            points = np.array([2 * position - other, 2 * other - position])
+            self.num_antinodes += self.update_counts(self.counts, points, delta)
+            line = get_line(position, other, self.board_size)
+            self.num_resonant_antinodes += self.update_counts(
+                self.resonant_counts, line, delta
+            )
+
+    def add_antenna(self, antenna: tuple[int, int], frequency: str):
+        assert antenna not in self.antennae_by_freq[frequency]
+        self.update_pairs(antenna, frequency, 1)
+        self.antennae_by_freq[frequency].append(antenna)
+
+    def remove_antenna(self, antenna: tuple[int, int], frequency: str):
+        self.antennae_by_freq[frequency].remove(antenna)
+        self.update_pairs(antenna, frequency, -1)
+
+    def toggle_antenna(self, antenna: tuple[int, int], frequency: str):
+        if antenna in self.antennae_by_freq[frequency]:
+            self.remove_antenna(antenna, frequency)
+        else:
+            self.add_antenna(antenna, frequency)
 
 
 def part_2(file_path: str):
     antennae_by_freq, board_size = read_file(file_path)
-    print(find_num_resonant_antinodes(antennae_by_freq, board_size))
+    return find_num_resonant_antinodes(antennae_by_freq, board_size)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("part", type=int)
     parser.add_argument("file_path", type=str)
+    # Add or remove antennae given as row,col,frequency before counting
+    parser.add_argument("-t", "--toggle", type=str, nargs="+", default=[])
     results = parser.parse_args()
 
     assert results.part in [1, 2]
 
-    if results.part == 1:
-        part_1(results.file_path)
+    if results.toggle:
+        antennae_by_freq, board_size = read_file(results.file_path)
+        index = AntinodeIndex.from_antennae(antennae_by_freq, board_size)
+        for toggle in results.toggle:
+            row, col, frequency = toggle.split(",")
+            index.toggle_antenna((int(row), int(col)), frequency)
+
+        if results.part == 1:
+            print(index.num_antinodes)
+        else:
+            print(index.num_resonant_antinodes)
+    elif results.part == 1:
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
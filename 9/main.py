@@ -1,138 +1,114 @@
 import argparse
-from enum import Enum
-
-class State(Enum):
-    FULL = 0
-    EMPTY = 1
-
-    def get_next(self):
-        return State((self.value + 1) % 2)
-
-
-def read_file(
-    file_path: str,
-) -> list[int]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        text = file.read().strip()
-
-    id_counter = 0
-    memory = []
-    state = State.FULL
-    for char in text:
-        num_blocks = int(char)
-        if state == State.FULL:
-            for _ in range(num_blocks):
-                memory.append(id_counter)
-            id_counter += 1
-            state = state.get_next()
-        else:
-            for _ in range(num_blocks):
-                memory.append(-1)
-            state = state.get_next()
-
-    return memory
-
-def compact_memory(memory: list[int]):
-    starting_index = 0
-    for from_index in reversed(range(len(memory))):
-        # Memory is not free
-        if memory[from_index] != -1:
-            for maybe_to_index in range(starting_index, from_index):
-                if maybe_to_index >= from_index:
-                    break
-                if memory[maybe_to_index] == -1:
-                    memory[maybe_to_index] = memory[from_index]
-                    memory[from_index] = -1
-                    break
-            starting_index = maybe_to_index
-        if maybe_to_index >= from_index:
+import heapq
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from common.inputs import map_file
+
+MAX_SPAN = 9
+# A run is a file id with the start and length of a contiguous span of its blocks
+Run = tuple[int, int, int]
+
+
+def read_disk_map(file_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Starts and lengths of every file, and the gap after each file but the last
+    digits = np.frombuffer(map_file(file_path), dtype=np.uint8)
+    digits = digits[(ord("0") <= digits) & (digits <= ord("9"))] - ord("0")
+    lengths = digits.astype(np.int64)
+    starts = np.cumsum(lengths) - lengths
+    file_starts, file_lengths = starts[0::2], lengths[0::2]
+    gap_starts, gap_lengths = starts[1::2], lengths[1::2]
+    return file_starts, file_lengths, np.stack([gap_starts, gap_lengths], axis=1)
+
+
+def compact_memory(
+    file_starts: np.ndarray, file_lengths: np.ndarray, gaps: np.ndarray
+) -> list[Run]:
+    # Two pointers: gaps are filled from the left with blocks taken from the
+    # rightmost file that has not been moved yet
+    starts, lengths = file_starts.tolist(), file_lengths.tolist()
+    runs: list[Run] = []
+    right = len(lengths) - 1
+    right_remaining = lengths[right]
+    for gap, (gap_start, gap_length) in enumerate(gaps.tolist()):
+        if gap >= right:
             break
 
-def memory_checksum(memory: list[int]) -> int:
-    checksum = 0
-    for position, file_id in enumerate(memory):
-        if file_id == -1:
-            continue
-        checksum += position * file_id
+        while gap_length > 0 and gap < right:
+            moved = min(gap_length, right_remaining)
+            runs.append((right, gap_start, moved))
+            gap_start += moved
+            gap_length -= moved
+            right_remaining -= moved
+            if right_remaining == 0:
+                right -= 1
+                right_remaining = lengths[right]
+
+    runs += [(file_id, starts[file_id], lengths[file_id]) for file_id in range(right)]
+    runs.append((right, starts[right], right_remaining))
+    return runs
+
+
+def memory_checksum(runs: list[Run]) -> int:
+    # Each run adds file_id * (start + ... + start + length - 1)
+    return sum(
+        file_id * (start * length + length * (length - 1) // 2)
+        for file_id, start, length in runs
+    )
 
-    return checksum
 
 def part_1(file_path: str):
-    memory = read_file(file_path)
-    compact_memory(memory)
-    print(memory_checksum(memory))
-
-
-def read_file_blocks(file_path: str) -> list[tuple[int, int]]:
-    with open(file_path, "r", encoding="UTF-8") as file:
-        text = file.read().strip()
-
-    id_counter = 0
-    memory_blocks: list[tuple[int, int]] = []
-    state = State.FULL
-    for char in text:
-        num_blocks = int(char)
-        if state == State.FULL:
-            memory_blocks.append((id_counter, num_blocks))
-            id_counter += 1
-            state = state.get_next()
-        else:
-            memory_blocks.append((-1, num_blocks))
-            state = state.get_next()
-
-    return memory_blocks
-
-def compact_memory_blocks(memory_blocks: list[tuple[int, int]]):
-    blocks_from_end = 1
-    while blocks_from_end < len(memory_blocks):
-        current_block = memory_blocks[-blocks_from_end]
-        block_id, block_size = current_block
-        if block_id == -1:
-            blocks_from_end += 1
-            continue
-
-        result = None
-        for move_index, move_block in enumerate(memory_blocks):
-            # Didn't find anything
-            if move_block == current_block:
-                break
-
-            # Check if found something
-            move_id, move_size = move_block
-            if move_id == -1 and move_size >= block_size:
-                result = (move_index, move_size)
-                break
-
-        # Found something
-        if result:
-            move_index, move_size = result
-            # Pure swap
-            if move_size == block_size:
-                memory_blocks[move_index] = (block_id, block_size)
-                memory_blocks[-blocks_from_end] = (-1, block_size)
-            # Memory left over
-            else:
-                memory_blocks[move_index] = (-1, move_size - block_size)
-                memory_blocks.insert(move_index, (block_id, block_size))
-                memory_blocks[-blocks_from_end] = (-1, block_size)
-
-        else:
-            blocks_from_end += 1
-
-def unblock_memory(memory_blocks: list[tuple[int, int]]) -> list[int]:
-    memory = []
-    for block in memory_blocks:
-        block_id, block_size = block
-        for _ in range(block_size):
-            memory.append(block_id)
-
-    return memory
+    file_starts, file_lengths, gaps = read_disk_map(file_path)
+    runs = compact_memory(file_starts, file_lengths, gaps)
+    return memory_checksum(runs)
+
+
+def compact_files(
+    file_starts: np.ndarray, file_lengths: np.ndarray, gaps: np.ndarray
+) -> list[Run]:
+    # free_starts[size] is a min-heap of the starts of free spans of that size.
+    # Spans are at most 9 blocks long, so the leftmost span that fits a file is
+    # the smallest start among the heaps for its length and above.
+    free_starts: list[list[int]] = [[] for _ in range(MAX_SPAN + 1)]
+    for gap_start, gap_length in gaps.tolist():
+        if gap_length > 0:
+            free_starts[gap_length].append(gap_start)
+
+    for heap in free_starts:
+        heapq.heapify(heap)
+
+    runs: list[Run] = []
+    starts, lengths = file_starts.tolist(), file_lengths.tolist()
+    for file_id in reversed(range(len(starts))):
+        start, length = starts[file_id], lengths[file_id]
+        best_size = None
+        for size in range(length, MAX_SPAN + 1):
+            heap = free_starts[size]
+            if heap and heap[0] < start and (
+                best_size is None or heap[0] < free_starts[best_size][0]
+            ):
+                best_size = size
+
+        if best_size is not None:
+            gap_start = heapq.heappop(free_starts[best_size])
+            if best_size > length:
+                heapq.heappush(free_starts[best_size - length], gap_start + length)
+            start = gap_start
+
+        runs.append((file_id, start, length))
+
+    return runs
+
 
 def part_2(file_path: str):
-    memory_blocks = read_file_blocks(file_path)
-    compact_memory_blocks(memory_blocks)
-    memory = unblock_memory(memory_blocks)
-    print(memory_checksum(memory))
+    file_starts, file_lengths, gaps = read_disk_map(file_path)
+    runs = compact_files(file_starts, file_lengths, gaps)
+    return memory_checksum(runs)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -143,6 +119,6 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
@@ -0,0 +1,76 @@
+import argparse
+import sys
+from pathlib import Path
+
+from common.benchmark import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_NOISE_FLOOR,
+    DEFAULT_REPEATS,
+    DEFAULT_THRESHOLD,
+    DEFAULT_TIME_BUDGET,
+    benchmark_job,
+    find_regression,
+    format_measurement,
+    load_baselines,
+    save_baselines,
+)
+from common.runner import DAYS, DEFAULT_INPUT, PARTS, discover_jobs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS)
+    parser.add_argument("-p", "--parts", type=int, nargs="+", default=PARTS)
+    parser.add_argument("-i", "--input", type=str, default=DEFAULT_INPUT)
+    parser.add_argument("-r", "--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("-b", "--budget", type=float, default=DEFAULT_TIME_BUDGET)
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD)
+    # Seconds a median may grow by before the threshold is checked at all
+    parser.add_argument("-n", "--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR)
+    parser.add_argument("--baselines", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("-u", "--update", action="store_true")
+    results = parser.parse_args()
+
+    assert all(day in DAYS for day in results.days)
+    assert all(part in PARTS for part in results.parts)
+    assert results.repeats >= 1
+
+    baselines = load_baselines(results.input, results.baselines)
+    measurements = []
+    regressions = []
+    failures = []
+    for job in discover_jobs(results.days, results.parts, results.input):
+        try:
+            measurement = benchmark_job(job, results.repeats, results.budget)
+        except Exception as error:
+            print(f"Day {job.day:2} part {job.part}: failed with {error!r}")
+            # A part that used to run and now crashes counts against the gate
+            if job.key in baselines:
+                failures.append(job)
+            else:
+                print("  no baseline, so this failure does not fail the run")
+            continue
+
+        measurements.append(measurement)
+        print(format_measurement(measurement))
+
+        regression = find_regression(
+            measurement, baselines, results.threshold, results.noise_floor
+        )
+        if regression:
+            regressions.append(regression)
+            print(f"  regressed {regression.ratio:.2f}x over the baseline median")
+
+    if results.update:
+        save_baselines(measurements, results.input, results.baselines)
+
+    if failures:
+        print(f"{len(failures)} part(s) with a baseline failed")
+
+    if regressions and not results.update:
+        print(
+            f"{len(regressions)} part(s) regressed by more than "
+            f"{results.threshold:.0%}"
+        )
+
+    if failures or (regressions and not results.update):
+        sys.exit(1)
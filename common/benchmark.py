@@ -0,0 +1,166 @@
+import json
+import math
+import statistics
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Optional
+
+from common.runner import ROOT, Job, get_solver
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE_PATH = ROOT / "benchmarks" / "baselines.json"
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25
+# Slowdowns smaller than this are timer and scheduling noise, whatever the ratio
+DEFAULT_NOISE_FLOOR = 0.005
+# Slow parts stop repeating once they have used up this much wall time
+DEFAULT_TIME_BUDGET = 30.0
+
+
+@dataclass(frozen=True)
+class Measurement:
+    day: int
+    part: int
+    runs: int
+    min_seconds: float
+    median_seconds: float
+    p95_seconds: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}.{self.part}"
+
+
+@dataclass(frozen=True)
+class Regression:
+    baseline: Measurement
+    current: Measurement
+
+    @property
+    def ratio(self) -> float:
+        return self.current.median_seconds / self.baseline.median_seconds
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    # Nearest-rank percentile, which stays meaningful for a handful of runs
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def measure_peak_memory(job: Job) -> int:
+    solver = get_solver(job.day, job.part, fresh=True)
+    assert solver is not None
+    tracemalloc.start()
+    try:
+        solver(job.file_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def benchmark_job(
+    job: Job,
+    repeats: int = DEFAULT_REPEATS,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+) -> Measurement:
+    # Memory is traced in its own run since tracemalloc skews the timings
+    peak_bytes = measure_peak_memory(job)
+
+    times: list[float] = []
+    while len(times) < repeats:
+        # Reloading the day keeps module-level memos from warming later runs
+        solver = get_solver(job.day, job.part, fresh=True)
+        assert solver is not None
+        start = perf_counter()
+        solver(job.file_path)
+        times.append(perf_counter() - start)
+        if sum(times) >= time_budget:
+            break
+
+    times.sort()
+    return Measurement(
+        day=job.day,
+        part=job.part,
+        runs=len(times),
+        min_seconds=times[0],
+        median_seconds=statistics.median(times),
+        p95_seconds=percentile(times, 0.95),
+        peak_bytes=peak_bytes,
+    )
+
+
+def _read_baseline_file(path: Path) -> dict[str, dict[str, dict]]:
+    if not path.exists():
+        return {}
+
+    with open(path, "r", encoding="UTF-8") as file:
+        data = json.load(file)
+
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"{path} has baseline version {data.get('version')}, "
+            f"expected {BASELINE_VERSION}"
+        )
+
+    return data["inputs"]
+
+
+def load_baselines(
+    input_name: str, path: Path = DEFAULT_BASELINE_PATH
+) -> dict[str, Measurement]:
+    results = _read_baseline_file(path).get(input_name, {})
+    return {key: Measurement(**value) for key, value in results.items()}
+
+
+def save_baselines(
+    measurements: Iterable[Measurement],
+    input_name: str,
+    path: Path = DEFAULT_BASELINE_PATH,
+):
+    # Merge into the existing file so partial runs only refresh what they measured
+    inputs = _read_baseline_file(path)
+    results = inputs.get(input_name, {})
+    for measurement in measurements:
+        results[measurement.key] = asdict(measurement)
+
+    inputs[input_name] = {
+        key: results[key]
+        for key in sorted(results, key=lambda x: tuple(int(y) for y in x.split(".")))
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="UTF-8") as file:
+        json.dump({"version": BASELINE_VERSION, "inputs": inputs}, file, indent=2)
+        file.write("\n")
+
+
+def find_regression(
+    current: Measurement,
+    baselines: dict[str, Measurement],
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor: float = DEFAULT_NOISE_FLOOR,
+) -> Optional[Regression]:
+    baseline = baselines.get(current.key)
+    if baseline is None:
+        return None
+
+    slowdown = current.median_seconds - baseline.median_seconds
+    if slowdown > noise_floor and slowdown > baseline.median_seconds * threshold:
+        return Regression(baseline, current)
+
+    return None
+
+
+def format_measurement(measurement: Measurement) -> str:
+    return (
+        f"Day {measurement.day:2} part {measurement.part}: "
+        f"min {measurement.min_seconds:.4f}s, "
+        f"median {measurement.median_seconds:.4f}s, "
+        f"p95 {measurement.p95_seconds:.4f}s, "
+        f"peak {measurement.peak_bytes / 2**20:.2f} MiB "
+        f"({measurement.runs} runs)"
+    )
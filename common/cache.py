@@ -0,0 +1,114 @@
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Optional
+
+from common.runner import ROOT, Job, Result, day_path
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "answers"
+DEFAULT_MAX_BYTES = 16 * 2**20
+
+
+def file_digest(path: Path) -> str:
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class AnswerCache:
+    def __init__(
+        self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._input_digests: dict[str, str] = {}
+        self._source_digests: dict[int, str] = {}
+
+    def input_digest(self, file_path: str) -> str:
+        if file_path not in self._input_digests:
+            self._input_digests[file_path] = file_digest(Path(file_path))
+
+        return self._input_digests[file_path]
+
+    def source_digest(self, day: int) -> str:
+        # Days share code through common/, so a change there invalidates every day
+        if day not in self._source_digests:
+            sources = [day_path(day)] + sorted((ROOT / "common").glob("*.py"))
+            digest = hashlib.sha256()
+            for source in sources:
+                digest.update(file_digest(source).encode())
+
+            self._source_digests[day] = digest.hexdigest()
+
+        return self._source_digests[day]
+
+    def entry_path(self, job: Job) -> Path:
+        key = (
+            f"{CACHE_VERSION}:{job.key}:"
+            f"{self.input_digest(job.file_path)}:{self.source_digest(job.day)}"
+        )
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+    def get(self, job: Job) -> Optional[Result]:
+        start = perf_counter()
+        path = self.entry_path(job)
+        try:
+            with open(path, "rb") as file:
+                answer = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # The modification time doubles as the last use for LRU eviction
+        os.utime(path)
+        return Result(job, answer, perf_counter() - start, cached=True)
+
+    def put(self, result: Result):
+        if result.error is not None or result.cached:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.entry_path(result.job)
+        # Write to a temporary file first so readers never see a partial entry
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as file:
+            pickle.dump(result.answer, file)
+
+        os.replace(temp_path, path)
+
+    def evict(self):
+        if not self.cache_dir.exists():
+            return
+
+        entries = [(path, path.stat()) for path in self.cache_dir.glob("*.pkl")]
+        entries.sort(key=lambda x: x[1].st_mtime_ns)
+        total_bytes = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total_bytes <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+
+    def clear(self):
+        if not self.cache_dir.exists():
+            return
+
+        for path in self.cache_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+def split_cached(
+    jobs: Iterable[Job], cache: AnswerCache
+) -> tuple[list[Result], list[Job]]:
+    hits: list[Result] = []
+    misses: list[Job] = []
+    for job in jobs:
+        result = cache.get(job)
+        if result is None:
+            misses.append(job)
+        else:
+            hits.append(result)
+
+    return hits, misses
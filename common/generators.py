@@ -0,0 +1,559 @@
+from typing import Callable
+
+import numpy as np
+
+# Scale 1 matches the size of the real puzzle inputs. Grid days scale the side
+# length, everything else scales the number of lines or records.
+Generator = Callable[[int, np.random.Generator], str]
+
+DIRECTION_CHARS = "^>v<"
+TOWEL_COLORS = "wubrg"
+FREQUENCY_CHARS = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# The part 2 solver extends A by one octal digit per program suffix and only
+# finds a quine for these constants of the real program's shape
+DAY_17_CONSTANTS = (5, 6)
+
+
+def grid_to_text(cells: np.ndarray) -> str:
+    return "\n".join(row.tobytes().decode() for row in cells.astype(np.uint8)) + "\n"
+
+
+def char_grid(
+    rng: np.random.Generator, num_rows: int, num_cols: int, chars: str, weights=None
+) -> np.ndarray:
+    codes = np.frombuffer(chars.encode(), dtype=np.uint8)
+    return rng.choice(codes, size=(num_rows, num_cols), p=weights)
+
+
+def perfect_maze(rng: np.random.Generator, size: int) -> np.ndarray:
+    # Randomized depth-first search over the odd cells, True marks an open cell
+    size = size if size % 2 else size + 1
+    is_open = np.zeros((size, size), dtype=bool)
+    stack = [(size - 2, 1)]
+    is_open[size - 2, 1] = True
+    steps = [(-2, 0), (0, 2), (2, 0), (0, -2)]
+    while stack:
+        row, col = stack[-1]
+        candidates = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in steps
+            if 0 < row + d_row < size - 1
+            and 0 < col + d_col < size - 1
+            and not is_open[row + d_row, col + d_col]
+        ]
+        if not candidates:
+            stack.pop()
+            continue
+
+        next_row, next_col = candidates[rng.integers(len(candidates))]
+        is_open[(row + next_row) // 2, (col + next_col) // 2] = True
+        is_open[next_row, next_col] = True
+        stack.append((next_row, next_col))
+
+    return is_open
+
+
+def maze_path(is_open: np.ndarray, start: tuple[int, int], end: tuple[int, int]):
+    num_rows, num_cols = is_open.shape
+    prev = {start: start}
+    queue = [start]
+    for row, col in queue:
+        if (row, col) == end:
+            break
+        for d_row, d_col in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
+            neighbor = (row + d_row, col + d_col)
+            if (
+                0 <= neighbor[0] < num_rows
+                and 0 <= neighbor[1] < num_cols
+                and is_open[neighbor]
+                and neighbor not in prev
+            ):
+                prev[neighbor] = (row, col)
+                queue.append(neighbor)
+
+    path = [end]
+    while path[-1] != start:
+        path.append(prev[path[-1]])
+
+    return path[::-1]
+
+
+def generate_day_1(scale: int, rng: np.random.Generator) -> str:
+    num_lines = 1000 * scale
+    left = rng.integers(10000, 100000, num_lines)
+    # Draw part of the right list from the left one so similarity scores are nonzero
+    right = np.where(
+        rng.random(num_lines) < 0.3,
+        rng.choice(left, num_lines),
+        rng.integers(10000, 100000, num_lines),
+    )
+    return "".join(f"{l_val}   {r_val}\n" for l_val, r_val in zip(left, right))
+
+
+def generate_day_2(scale: int, rng: np.random.Generator) -> str:
+    lines: list[str] = []
+    for _ in range(1000 * scale):
+        length = int(rng.integers(5, 9))
+        sign = rng.choice([-1, 1])
+        steps = sign * rng.integers(1, 4, length - 1)
+        # Corrupt some reports so both safe and unsafe ones appear
+        if rng.random() < 0.5:
+            steps[rng.integers(length - 1)] = rng.integers(-5, 6)
+
+        report = np.concatenate([[rng.integers(10, 90)], steps]).cumsum()
+        lines.append(" ".join(str(x) for x in report))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_3(scale: int, rng: np.random.Generator) -> str:
+    tokens = [
+        "mul(",
+        ")",
+        ",",
+        "do()",
+        "don't()",
+        "mul[",
+        "what()",
+        "from()",
+        "select()",
+        "#",
+        "%",
+        "'",
+        " ",
+        "<",
+        ">",
+    ]
+    lines: list[str] = []
+    for _ in range(6 * scale):
+        parts: list[str] = []
+        length = 0
+        while length < 3200:
+            if rng.random() < 0.25:
+                part = f"mul({rng.integers(1, 1000)},{rng.integers(1, 1000)})"
+            elif rng.random() < 0.3:
+                part = str(rng.integers(0, 1000))
+            else:
+                part = tokens[rng.integers(len(tokens))]
+            parts.append(part)
+            length += len(part)
+        lines.append("".join(parts))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_4(scale: int, rng: np.random.Generator) -> str:
+    side = 140 * scale
+    return grid_to_text(char_grid(rng, side, side, "XMAS"))
+
+
+def generate_day_5(scale: int, rng: np.random.Generator) -> str:
+    num_pages = 49 * scale
+    pages = rng.permutation(np.arange(10, 10 + num_pages))
+    rules: set[tuple[int, int]] = set()
+    updates: list[list[int]] = []
+    for _ in range(200 * scale):
+        length = int(rng.choice(np.arange(5, 24, 2)))
+        # Updates draw from a window of the global order so rules stay local
+        window_start = int(rng.integers(0, max(1, num_pages - 2 * length)))
+        window = np.arange(window_start, min(num_pages, window_start + 2 * length))
+        ranks = np.sort(rng.choice(window, min(length, len(window)), replace=False))
+        update = pages[ranks].tolist()
+        for i, before in enumerate(update):
+            for after in update[i + 1 :]:
+                rules.add((before, after))
+
+        if rng.random() < 0.5:
+            rng.shuffle(update)
+        updates.append(update)
+
+    rule_list = sorted(rules)
+    rule_order = rng.permutation(len(rule_list))
+    rule_lines = [f"{rule_list[i][0]}|{rule_list[i][1]}" for i in rule_order]
+    update_lines = [",".join(str(x) for x in update) for update in updates]
+    return "\n".join(rule_lines) + "\n\n" + "\n".join(update_lines) + "\n"
+
+
+def guard_walk_length(obstacles: np.ndarray, row: int, col: int) -> int:
+    num_rows, num_cols = obstacles.shape
+    d_row, d_col = -1, 0
+    visited: set[tuple[int, int, int, int]] = set()
+    while (row, col, d_row, d_col) not in visited:
+        visited.add((row, col, d_row, d_col))
+        next_row, next_col = row + d_row, col + d_col
+        if not (0 <= next_row < num_rows and 0 <= next_col < num_cols):
+            break
+
+        if obstacles[next_row, next_col]:
+            d_row, d_col = d_col, -d_row
+        else:
+            row, col = next_row, next_col
+
+    return len(visited)
+
+
+def generate_day_6(scale: int, rng: np.random.Generator) -> str:
+    side = 130 * scale
+    cells = char_grid(rng, side, side, ".#", [0.95, 0.05])
+    open_cells = np.argwhere(cells == ord("."))
+    # Most random starts leave the map within a few turns, so keep the longest walk
+    candidates = open_cells[rng.integers(len(open_cells), size=200)].tolist()
+    obstacles = cells == ord("#")
+    row, col = max(candidates, key=lambda x: guard_walk_length(obstacles, *x))
+    cells[row, col] = ord("^")
+    return grid_to_text(cells)
+
+
+def generate_day_7(scale: int, rng: np.random.Generator) -> str:
+    lines: list[str] = []
+    while len(lines) < 850 * scale:
+        length = int(rng.integers(3, 13))
+        operands = rng.integers(1, 1000, length)
+        operands[rng.random(length) < 0.6] %= 10
+        operands[operands == 0] = 1
+        result = int(operands[0])
+        for operand in operands[1:].tolist():
+            operator = rng.integers(3)
+            if operator == 0:
+                result += operand
+            elif operator == 1:
+                result *= operand
+            else:
+                result = int(f"{result}{operand}")
+
+        # Keep results in the range of the real input, which fits in 64 bits
+        if result >= 10**15:
+            continue
+
+        # Make roughly half of the equations unsolvable
+        if rng.random() < 0.5:
+            result += 1
+        lines.append(f"{result}: " + " ".join(str(x) for x in operands))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_day_8(scale: int, rng: np.random.Generator) -> str:
+    side = 50 * scale
+    cells = np.full((side, side), ord("."), dtype=np.uint8)
+    num_antennae = 200 * scale * scale
+    flat = rng.choice(side * side, min(num_antennae, side * side), replace=False)
+    frequencies = np.frombuffer(FREQUENCY_CHARS.encode(), dtype=np.uint8)
+    cells.flat[flat] = rng.choice(frequencies, len(flat))
+    return grid_to_text(cells)
+
+
+def generate_day_9(scale: int, rng: np.random.Generator) -> str:
+    num_digits = 20000 * scale - 1
+    digits = rng.integers(0, 10, num_digits)
+    # Files are never empty, free space can be
+    digits[::2] = rng.integers(1, 10, len(digits[::2]))
+    return "".join(str(x) for x in digits) + "\n"
+
+
+def generate_day_10(scale: int, rng: np.random.Generator) -> str:
+    side = 59 * scale
+    rows, cols = np.indices((side, side))
+    heights = np.zeros((side, side), dtype=int)
+    # Overlapping diamond shaped hills give long monotone trails
+    for _ in range(4 * scale * scale):
+        center_row, center_col = rng.integers(0, side, 2)
+        distance = np.abs(rows - center_row) + np.abs(cols - center_col)
+        heights = np.maximum(heights, 9 - distance)
+
+    noise = rng.random((side, side)) < 0.05
+    heights[noise] = rng.integers(0, 10, int(noise.sum()))
+    return grid_to_text(heights + ord("0"))
+
+
+def generate_day_11(scale: int, rng: np.random.Generator) -> str:
+    stones = rng.integers(0, 10**6, 8 * scale)
+    return " ".join(str(x) for x in stones) + "\n"
+
+
+def generate_day_12(scale: int, rng: np.random.Generator) -> str:
+    side = 140 * scale
+    block = 7
+    coarse_side = -(-side // block)
+    coarse = char_grid(rng, coarse_side, coarse_side, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    cells = np.kron(coarse, np.ones((block, block), dtype=np.uint8))[:side, :side]
+    # Scatter single cell plots so regions have ragged edges
+    noise = rng.random((side, side)) < 0.05
+    cells[noise] = char_grid(rng, 1, int(noise.sum()), "ABCDEFGHIJKLMNOPQRSTUVWXYZ")[0]
+    return grid_to_text(cells)
+
+
+def generate_day_13(scale: int, rng: np.random.Generator) -> str:
+    games: list[str] = []
+    for _ in range(320 * scale):
+        a = rng.integers(10, 100, 2)
+        b = rng.integers(10, 100, 2)
+        if rng.random() < 0.5:
+            prize = rng.integers(1, 101) * a + rng.integers(1, 101) * b
+        else:
+            prize = rng.integers(1000, 20000, 2)
+        games.append(
+            f"Button A: X+{a[0]}, Y+{a[1]}\n"
+            f"Button B: X+{b[0]}, Y+{b[1]}\n"
+            f"Prize: X={prize[0]}, Y={prize[1]}\n"
+        )
+
+    return "\n".join(games)
+
+
+def generate_day_14(scale: int, rng: np.random.Generator) -> str:
+    # The solver has a fixed 101 by 103 board, so only the robot count scales
+    num_robots = 500 * scale
+    x = rng.integers(0, 101, num_robots)
+    y = rng.integers(0, 103, num_robots)
+    v_x = rng.integers(-100, 101, num_robots)
+    v_y = rng.integers(-100, 101, num_robots)
+    return "".join(
+        f"p={a},{b} v={c},{d}\n" for a, b, c, d in zip(x, y, v_x, v_y)
+    )
+
+
+def generate_day_15(scale: int, rng: np.random.Generator) -> str:
+    side = 50 * scale
+    cells = char_grid(rng, side, side, ".O#", [0.6, 0.3, 0.1])
+    cells[[0, -1], :] = ord("#")
+    cells[:, [0, -1]] = ord("#")
+    cells[side // 2, side // 2] = ord("@")
+    moves = char_grid(rng, 20 * scale, 1000, DIRECTION_CHARS)
+    return grid_to_text(cells) + "\n" + grid_to_text(moves)
+
+
+def generate_day_16(scale: int, rng: np.random.Generator) -> str:
+    is_open = perfect_maze(rng, 141 * scale)
+    size = len(is_open)
+    # Knock out some interior walls so there are several paths to compare
+    walls = np.argwhere(~is_open[1:-1, 1:-1]) + 1
+    knocked = walls[rng.random(len(walls)) < 0.05]
+    is_open[knocked[:, 0], knocked[:, 1]] = True
+
+    cells = np.where(is_open, ord("."), ord("#"))
+    cells[size - 2, 1] = ord("S")
+    cells[1, size - 2] = ord("E")
+    return grid_to_text(cells)
+
+
+def generate_day_17(scale: int, rng: np.random.Generator) -> str:
+    # bst A, bxl k1, cdv B, bxc, bxl k2, adv 3, out B, jnz 0 like the real program
+    k1, k2 = DAY_17_CONSTANTS
+    program = [2, 4, 1, k1, 7, 5, 4, 1, 1, k2, 0, 3, 5, 5, 3, 0]
+
+    num_octal_digits = 10 * scale
+    a = int(rng.integers(1, 8))
+    for _ in range(num_octal_digits - 1):
+        a = a * 8 + int(rng.integers(0, 8))
+
+    return (
+        f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\n"
+        f"Program: {','.join(str(x) for x in program)}\n"
+    )
+
+
+def generate_day_18(scale: int, rng: np.random.Generator) -> str:
+    # The solver has a fixed 71 by 71 board, so the byte count is capped by its area
+    cells = rng.permutation(71 * 71)
+    cells = cells[(cells != 0) & (cells != 71 * 71 - 1)]
+    cells = cells[: min(len(cells), 3450 * scale)]
+    return "".join(f"{x},{y}\n" for x, y in zip(cells // 71, cells % 71))
+
+
+def generate_day_19(scale: int, rng: np.random.Generator) -> str:
+    towels = sorted(
+        {
+            "".join(rng.choice(list(TOWEL_COLORS), int(rng.integers(1, 9))))
+            for _ in range(450)
+        }
+    )
+    patterns: list[str] = []
+    for _ in range(400 * scale):
+        pattern = ""
+        target_length = int(rng.integers(20, 61))
+        while len(pattern) < target_length:
+            pattern += towels[rng.integers(len(towels))]
+        # Random stripes on the end make some of the patterns impossible
+        if rng.random() < 0.3:
+            pattern += "".join(rng.choice(list(TOWEL_COLORS), int(rng.integers(3, 7))))
+        patterns.append(pattern)
+
+    return ", ".join(towels) + "\n\n" + "\n".join(patterns) + "\n"
+
+
+def generate_day_20(scale: int, rng: np.random.Generator) -> str:
+    is_open = perfect_maze(rng, 141 * scale)
+    size = len(is_open)
+    start = (size - 2, 1)
+    end = (1, size - 2)
+    # The race track is the unique maze path, every other cell becomes wall
+    track = np.zeros_like(is_open)
+    for position in maze_path(is_open, start, end):
+        track[position] = True
+
+    cells = np.where(track, ord("."), ord("#"))
+    cells[start] = ord("S")
+    cells[end] = ord("E")
+    return grid_to_text(cells)
+
+
+def generate_day_21(scale: int, rng: np.random.Generator) -> str:
+    codes = rng.integers(0, 1000, 5 * scale)
+    return "".join(f"{code:03}A\n" for code in codes)
+
+
+def generate_day_22(scale: int, rng: np.random.Generator) -> str:
+    secrets = rng.integers(1, 16777216, 2300 * scale)
+    return "".join(f"{secret}\n" for secret in secrets)
+
+
+def generate_day_23(scale: int, rng: np.random.Generator) -> str:
+    num_nodes = 520 * scale
+    name_length = 2
+    while 26**name_length < num_nodes:
+        name_length += 1
+
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    codes = rng.choice(26**name_length, num_nodes, replace=False)
+    names = [
+        "".join(letters[(code // 26 ** np.arange(name_length)[::-1]) % 26])
+        for code in codes
+    ]
+
+    # Part 2 enumerates every subset of a neighborhood, so the degree stays at 13
+    degree = 13
+    edges: set[tuple[int, int]] = set()
+    clique = rng.choice(num_nodes, degree, replace=False).tolist()
+    for i, a in enumerate(clique):
+        for b in clique[i + 1 :]:
+            edges.add((min(a, b), max(a, b)))
+
+    degrees = np.zeros(num_nodes, dtype=int)
+    for a, b in edges:
+        degrees[a] += 1
+        degrees[b] += 1
+
+    for node in rng.permutation(num_nodes).tolist():
+        candidates = np.flatnonzero(degrees < degree)
+        candidates = candidates[candidates != node]
+        needed = degree - degrees[node]
+        if needed <= 0 or len(candidates) == 0:
+            continue
+        others = rng.choice(candidates, min(needed, len(candidates)), replace=False)
+        for other in others.tolist():
+            edge = (min(node, other), max(node, other))
+            if edge not in edges:
+                edges.add(edge)
+                degrees[node] += 1
+                degrees[other] += 1
+
+    edge_list = list(edges)
+    order = rng.permutation(len(edge_list))
+    return "".join(
+        f"{names[edge_list[i][0]]}-{names[edge_list[i][1]]}\n" for i in order
+    )
+
+
+def generate_day_24(scale: int, rng: np.random.Generator) -> str:
+    # A correct ripple-carry adder with randomly named internal wires
+    num_bits = 45 * scale
+    letters = list("abcdefghjkmnpqrstvw")
+    name_length = 3
+    while len(letters) ** name_length < 10 * 3 * num_bits:
+        name_length += 1
+    used: set[str] = set()
+
+    def wire() -> str:
+        while True:
+            name = "".join(rng.choice(letters, name_length))
+            if name not in used:
+                used.add(name)
+                return name
+
+    x_bits = rng.integers(0, 2, num_bits)
+    y_bits = rng.integers(0, 2, num_bits)
+    gates: list[str] = []
+    carry = None
+    for i in range(num_bits):
+        x, y, z = f"x{i:02}", f"y{i:02}", f"z{i:02}"
+        if carry is None:
+            carry = wire()
+            gates.append(f"{x} XOR {y} -> {z}")
+            gates.append(f"{x} AND {y} -> {carry}")
+            continue
+
+        half_sum, half_carry, carry_through = wire(), wire(), wire()
+        next_carry = f"z{num_bits:02}" if i == num_bits - 1 else wire()
+        gates.append(f"{x} XOR {y} -> {half_sum}")
+        gates.append(f"{x} AND {y} -> {half_carry}")
+        gates.append(f"{carry} XOR {half_sum} -> {z}")
+        gates.append(f"{carry} AND {half_sum} -> {carry_through}")
+        gates.append(f"{half_carry} OR {carry_through} -> {next_carry}")
+        carry = next_carry
+
+    initial = [f"x{i:02}: {bit}" for i, bit in enumerate(x_bits)]
+    initial += [f"y{i:02}: {bit}" for i, bit in enumerate(y_bits)]
+    order = rng.permutation(len(gates))
+    return "\n".join(initial) + "\n\n" + "\n".join(gates[i] for i in order) + "\n"
+
+
+def generate_day_25(scale: int, rng: np.random.Generator) -> str:
+    schematics: list[str] = []
+    for _ in range(500 * scale):
+        heights = rng.integers(0, 6, 5)
+        rows = np.arange(5)[:, None] < heights[None, :]
+        is_lock = rng.random() < 0.5
+        if is_lock:
+            body = rows
+            top, bottom = "#####", "....."
+        else:
+            body = rows[::-1]
+            top, bottom = ".....", "#####"
+        lines = ["".join("#" if x else "." for x in row) for row in body]
+        schematics.append("\n".join([top, *lines, bottom]))
+
+    return "\n\n".join(schematics) + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+    7: generate_day_7,
+    8: generate_day_8,
+    9: generate_day_9,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    20: generate_day_20,
+    21: generate_day_21,
+    22: generate_day_22,
+    23: generate_day_23,
+    24: generate_day_24,
+    25: generate_day_25,
+}
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> str:
+    assert scale >= 1
+    # Seeding on the day as well keeps each day's input independent of the others
+    rng = np.random.default_rng([seed, day, scale])
+    return GENERATORS[day](scale, rng)
+
+
+def generated_input_name(scale: int, seed: int = 0) -> str:
+    if seed == 0:
+        return f"generated_x{scale}"
+
+    return f"generated_x{scale}_seed{seed}"
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from typing import Iterable, Union
+
+import numpy as np
+
+from common.inputs import byte_grid
+
+# Row and column offsets, ordered up, right, down, left
+OFFSETS = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)])
+
+
+def shift(array: np.ndarray, d_row: int, d_col: int, fill=0) -> np.ndarray:
+    # result[row, col] == array[row + d_row, col + d_col], or fill when off the grid
+    num_rows, num_cols = array.shape[:2]
+    result = np.full_like(array, fill)
+    result[
+        max(0, -d_row) : num_rows - max(0, d_row),
+        max(0, -d_col) : num_cols - max(0, d_col),
+    ] = array[
+        max(0, d_row) : num_rows - max(0, -d_row),
+        max(0, d_col) : num_cols - max(0, -d_col),
+    ]
+    return result
+
+
+@dataclass
+class Grid:
+    cells: np.ndarray
+
+    def __post_init__(self):
+        assert self.cells.ndim == 2
+        # Always copy, since buffers from bytes or memory maps are read-only
+        self.cells = np.array(self.cells, dtype=np.uint8, order="C", copy=True)
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "Grid":
+        return cls(byte_grid(file_path))
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]]) -> "Grid":
+        rows = [line.encode() if isinstance(line, str) else line for line in lines]
+        buffer = b"".join(rows)
+        return cls(np.frombuffer(buffer, dtype=np.uint8).reshape(len(rows), -1))
+
+    @classmethod
+    def full(cls, num_rows: int, num_cols: int, char: str = ".") -> "Grid":
+        return cls(np.full((num_rows, num_cols), ord(char), dtype=np.uint8))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def num_rows(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def num_cols(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def size(self) -> int:
+        return self.cells.size
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        return chr(self.cells[position])
+
+    def __setitem__(self, position: tuple[int, int], char: str):
+        self.cells[position] = ord(char)
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def mask(self, chars: str) -> np.ndarray:
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def find(self, chars: str) -> np.ndarray:
+        return np.argwhere(self.mask(chars))
+
+    def find_one(self, char: str) -> tuple[int, int]:
+        positions = self.find(char)
+        assert len(positions) == 1
+        return int(positions[0, 0]), int(positions[0, 1])
+
+    def in_bounds(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return (
+            (0 <= rows) & (rows < self.num_rows) & (0 <= cols) & (cols < self.num_cols)
+        )
+
+    def to_flat(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return rows * self.num_cols + cols
+
+    def from_flat(self, flat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return np.divmod(flat, self.num_cols)
+
+    def neighbors(self, flat: np.ndarray) -> np.ndarray:
+        # One column per direction in OFFSETS, with -1 for neighbors off the grid
+        rows, cols = self.from_flat(np.asarray(flat))
+        neighbor_rows = rows[..., None] + OFFSETS[:, 0]
+        neighbor_cols = cols[..., None] + OFFSETS[:, 1]
+        valid = self.in_bounds(neighbor_rows, neighbor_cols)
+        return np.where(valid, self.to_flat(neighbor_rows, neighbor_cols), -1)
+
+    def same_as_neighbor(self) -> np.ndarray:
+        # same[direction, row, col] is set when the neighbor holds the same character
+        return np.stack(
+            [
+                shift(self.cells, d_row, d_col, fill=0) == self.cells
+                for d_row, d_col in OFFSETS
+            ]
+        )
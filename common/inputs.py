@@ -0,0 +1,133 @@
+import mmap
+from typing import Iterator, Union
+
+import numpy as np
+
+Buffer = Union[mmap.mmap, bytes]
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+MINUS = ord("-")
+# Integers are parsed in slices of this many bytes to bound temporary arrays
+PARSE_CHUNK_SIZE = 1 << 24
+
+
+def map_file(file_path: str) -> Buffer:
+    with open(file_path, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # Empty files cannot be mapped
+        except ValueError:
+            return b""
+
+
+def iter_lines(file_path: str) -> Iterator[memoryview]:
+    buffer = map_file(file_path)
+    view = memoryview(buffer)
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = len(buffer)
+
+        line_end = end
+        if line_end > start and buffer[line_end - 1] == CARRIAGE_RETURN:
+            line_end -= 1
+
+        yield view[start:line_end]
+        start = end + 1
+
+
+def byte_grid(file_path: str) -> np.ndarray:
+    data = np.frombuffer(map_file(file_path), dtype=np.uint8)
+    newlines = np.flatnonzero(data == NEWLINE)
+    if len(newlines) == 0:
+        return data.reshape(1, -1)
+
+    stride = int(newlines[0]) + 1
+    num_cols = stride - 1
+    if num_cols > 0 and data[num_cols - 1] == CARRIAGE_RETURN:
+        num_cols -= 1
+
+    # The final line may or may not be newline terminated
+    num_rows = len(data) // stride
+    if data[-1] != NEWLINE:
+        num_rows += 1
+
+    row_ends = newlines[:num_rows]
+    assert (row_ends == np.arange(1, len(row_ends) + 1) * stride - 1).all()
+    return np.lib.stride_tricks.as_strided(
+        data, shape=(num_rows, num_cols), strides=(stride, 1), writeable=False
+    )
+
+
+def _parse_chunk(data: np.ndarray, offset: int) -> tuple[np.ndarray, np.ndarray]:
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64), starts
+
+    # Each digit contributes digit * 10^(distance to the end of its integer)
+    lengths = ends - starts
+    digit_indices = np.flatnonzero(is_digit)
+    exponents = np.repeat(ends, lengths) - 1 - digit_indices
+    digits = (data[digit_indices] - ord("0")).astype(np.int64)
+    contributions = digits * np.power(10, exponents, dtype=np.int64)
+    values = np.add.reduceat(contributions, np.cumsum(lengths) - lengths)
+
+    negative = np.zeros(len(starts), dtype=bool)
+    has_prefix = starts > 0
+    negative[has_prefix] = data[starts[has_prefix] - 1] == MINUS
+    values[negative] *= -1
+    return values, starts + offset
+
+
+def iter_int_chunks(
+    buffer: Buffer, chunk_size: int = PARSE_CHUNK_SIZE
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    start = 0
+    while start < len(data):
+        end = min(start + chunk_size, len(data))
+        # Extend the chunk so that no integer is split across two chunks
+        while end < len(data) and ord("0") <= data[end] <= ord("9"):
+            end += 1
+
+        yield _parse_chunk(data[start:end], start)
+        start = end
+
+
+def parse_ints_with_offsets(buffer: Buffer) -> tuple[np.ndarray, np.ndarray]:
+    values: list[np.ndarray] = []
+    offsets: list[np.ndarray] = []
+    for chunk_values, chunk_offsets in iter_int_chunks(buffer):
+        values.append(chunk_values)
+        offsets.append(chunk_offsets)
+
+    if not values:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    return np.concatenate(values), np.concatenate(offsets)
+
+
+def parse_ints(buffer: Buffer) -> np.ndarray:
+    return parse_ints_with_offsets(buffer)[0]
+
+
+def int_columns(file_path: str, num_columns: int) -> np.ndarray:
+    values = parse_ints(map_file(file_path))
+    assert len(values) % num_columns == 0
+    return values.reshape(-1, num_columns)
+
+
+def int_rows(file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    buffer = map_file(file_path)
+    values, offsets = parse_ints_with_offsets(buffer)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    newlines = np.flatnonzero(data == NEWLINE)
+    line_numbers = np.searchsorted(newlines, offsets)
+    num_lines = len(newlines) + int(len(data) > 0 and data[-1] != NEWLINE)
+    row_lengths = np.bincount(line_numbers, minlength=num_lines)
+    return values, row_lengths
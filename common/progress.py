@@ -0,0 +1,15 @@
+_verbose = False
+
+
+def set_verbose(verbose: bool = True):
+    global _verbose
+    _verbose = verbose
+
+
+def is_verbose() -> bool:
+    return _verbose
+
+
+def progress(*args, **kwargs):
+    if _verbose:
+        print(*args, **kwargs)
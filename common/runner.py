@@ -0,0 +1,139 @@
+import importlib.util
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from common.progress import is_verbose, set_verbose
+
+ROOT = Path(__file__).resolve().parent.parent
+DAYS = list(range(1, 26))
+PARTS = [1, 2]
+DEFAULT_INPUT = "test_input"
+
+Solver = Callable[[str], Any]
+
+_modules: dict[int, ModuleType] = {}
+
+
+@dataclass(frozen=True)
+class Job:
+    day: int
+    part: int
+    file_path: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}.{self.part}"
+
+
+@dataclass(frozen=True)
+class Result:
+    job: Job
+    answer: Any
+    seconds: float
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def day_path(day: int) -> Path:
+    return ROOT / str(day) / "main.py"
+
+
+def load_day(day: int, fresh: bool = False) -> ModuleType:
+    # A fresh load re-executes the module, dropping any module-level memos
+    if day in _modules and not fresh:
+        return _modules[day]
+
+    if str(ROOT) not in sys.path:
+        sys.path.append(str(ROOT))
+
+    module_name = f"day_{day}"
+    spec = importlib.util.spec_from_file_location(module_name, day_path(day))
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve their module through sys.modules while being created
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _modules[day] = module
+    return module
+
+
+def get_solver(day: int, part: int, fresh: bool = False) -> Optional[Solver]:
+    if not day_path(day).exists():
+        return None
+
+    return getattr(load_day(day, fresh), f"part_{part}", None)
+
+
+def discover_jobs(
+    days: Iterable[int] = DAYS,
+    parts: Iterable[int] = PARTS,
+    input_name: str = DEFAULT_INPUT,
+) -> list[Job]:
+    jobs: list[Job] = []
+    for day in days:
+        file_path = ROOT / str(day) / input_name
+        if not file_path.exists():
+            continue
+
+        for part in parts:
+            if get_solver(day, part) is not None:
+                jobs.append(Job(day, part, str(file_path)))
+
+    return jobs
+
+
+def run_job(job: Job) -> Result:
+    solver = get_solver(job.day, job.part)
+    assert solver is not None
+    start = perf_counter()
+    try:
+        answer = solver(job.file_path)
+    except Exception as error:
+        return Result(job, None, perf_counter() - start, repr(error))
+
+    return Result(job, answer, perf_counter() - start)
+
+
+def order_longest_first(
+    jobs: Iterable[Job], expected_seconds: dict[str, float]
+) -> list[Job]:
+    # Jobs without a recorded timing might be slow, so they are started first
+    return sorted(
+        jobs, key=lambda job: expected_seconds.get(job.key, math.inf), reverse=True
+    )
+
+
+def run_jobs(jobs: Iterable[Job]) -> Iterator[Result]:
+    for job in jobs:
+        yield run_job(job)
+
+
+def run_jobs_parallel(
+    jobs: Iterable[Job], workers: Optional[int] = None
+) -> Iterator[Result]:
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_verbose, initargs=(is_verbose(),)
+    ) as executor:
+        # Submission order is the scheduling order, so pass jobs longest first
+        futures = [executor.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def format_result(result: Result) -> str:
+    job = result.job
+    label = f"Day {job.day:2} part {job.part}"
+    timing = "cached" if result.cached else f"{result.seconds:.4f}s"
+    if result.error is not None:
+        return f"{label}: failed with {result.error} ({timing})"
+
+    if result.answer is None:
+        return f"{label}: ({timing})"
+
+    return f"{label}: {result.answer} ({timing})"
@@ -0,0 +1,21 @@
+import argparse
+
+from common.generators import GENERATORS, generate, generated_input_name
+from common.runner import DAYS, ROOT
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS)
+    parser.add_argument("-s", "--scales", type=int, nargs="+", default=[1])
+    parser.add_argument("--seed", type=int, default=0)
+    results = parser.parse_args()
+
+    assert all(day in GENERATORS for day in results.days)
+    assert all(scale >= 1 for scale in results.scales)
+
+    for day in results.days:
+        for scale in results.scales:
+            file_path = ROOT / str(day) / generated_input_name(scale, results.seed)
+            with open(file_path, "w", encoding="UTF-8") as file:
+                file.write(generate(day, scale, results.seed))
+            print(file_path.relative_to(ROOT))
@@ -4,10 +4,10 @@ template = """import argparse
 
 
 def part_1(file_path: str):
-    pass
+    return None
 
 def part_2(file_path: str):
-    pass
+    return None
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -18,9 +18,9 @@ if __name__ == "__main__":
     assert results.part in [1, 2]
 
     if results.part == 1:
-        part_1(results.file_path)
+        print(part_1(results.file_path))
     else:
-        part_2(results.file_path)
+        print(part_2(results.file_path))
 """
 
 for day in range(25):
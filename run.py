@@ -0,0 +1,65 @@
+import argparse
+from itertools import chain
+from time import perf_counter
+
+from common.benchmark import load_baselines
+from common.cache import AnswerCache, split_cached
+from common.progress import set_verbose
+from common.runner import (
+    DAYS,
+    DEFAULT_INPUT,
+    PARTS,
+    discover_jobs,
+    format_result,
+    order_longest_first,
+    run_jobs,
+    run_jobs_parallel,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS)
+    parser.add_argument("-p", "--parts", type=int, nargs="+", default=PARTS)
+    parser.add_argument("-i", "--input", type=str, default=DEFAULT_INPUT)
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--clear-cache", action="store_true")
+    results = parser.parse_args()
+
+    assert all(day in DAYS for day in results.days)
+    assert all(part in PARTS for part in results.parts)
+    assert results.jobs >= 1
+    set_verbose(results.verbose)
+
+    start = perf_counter()
+    jobs = discover_jobs(results.days, results.parts, results.input)
+    cache = None if results.no_cache else AnswerCache()
+    if cache is not None and results.clear_cache:
+        cache.clear()
+
+    cached_results = []
+    if cache is not None:
+        cached_results, jobs = split_cached(jobs, cache)
+
+    if results.jobs == 1:
+        job_results = run_jobs(jobs)
+    else:
+        expected_seconds = {
+            key: measurement.median_seconds
+            for key, measurement in load_baselines(results.input).items()
+        }
+        jobs = order_longest_first(jobs, expected_seconds)
+        job_results = run_jobs_parallel(jobs, results.jobs)
+
+    cpu_seconds = 0.0
+    for result in chain(cached_results, job_results):
+        cpu_seconds += result.seconds
+        print(format_result(result))
+        if cache is not None:
+            cache.put(result)
+
+    if cache is not None:
+        cache.evict()
+
+    print(f"Total: {perf_counter() - start:.4f}s (sum of parts {cpu_seconds:.4f}s)")